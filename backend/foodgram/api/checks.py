@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+from foodgram.routers import replica_configured
+
+
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def uses_process_local_cache():
+    return settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    if not uses_process_local_cache():
+        return []
+    return [Warning(
+        'Кеш по умолчанию не разделяется между процессами.',
+        hint=('Кеш каталогов сбрасывается только в процессе, изменившем '
+              'данные, а лимиты частоты запросов считаются отдельно в '
+              'каждом процессе. Укажите общий кеш в CACHE_BACKEND и '
+              'CACHE_LOCATION.'),
+        id='api.W001'
+    )]
+
+
+@register(Tags.caches)
+def check_replica_cache(app_configs, **kwargs):
+    if not replica_configured() or not uses_process_local_cache():
+        return []
+    return [Error(
+        'Реплика базы данных настроена без общего кеша.',
+        hint=('Запросы пользователя после изменения данных читаются из '
+              'основной базы по отметке в кеше, которую должны видеть все '
+              'процессы. Укажите общий кеш в CACHE_BACKEND и '
+              'CACHE_LOCATION.'),
+        id='api.E001'
+    )]
@@ -0,0 +1,88 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+from rest_framework.permissions import SAFE_METHODS
+
+from foodgram.routers import (
+    is_pinned_to_primary,
+    replica_configured,
+    use_replica
+)
+
+
+CATALOG_CACHE_KEY = 'catalog:{}'
+
+
+class RowRenderMixin:
+    def render_rows(self, queryset):
+        serializer = self.get_serializer()
+        renderer = self.request.accepted_renderer
+        media_type = self.request.accepted_media_type
+        renderer_context = self.get_renderer_context()
+        separator = b'['
+        for obj in queryset.iterator(chunk_size=settings.STREAM_CHUNK_SIZE):
+            yield separator + renderer.render(
+                serializer.to_representation(obj),
+                media_type,
+                renderer_context
+            )
+            separator = b','
+        yield b'[]' if separator == b'[' else b']'
+
+
+class CachedCatalogMixin(RowRenderMixin):
+    catalog_name = None
+
+    def list(self, request, *args, **kwargs):
+        if (request.query_params
+                or request.accepted_media_type != 'application/json'):
+            return super().list(request, *args, **kwargs)
+        key = CATALOG_CACHE_KEY.format(self.catalog_name)
+        payload = cache.get(key)
+        if payload is None:
+            content = b''.join(
+                self.render_rows(self.get_queryset().using('default'))
+            )
+            compressed_content = None
+            if len(content) >= settings.GZIP_MIN_LENGTH:
+                compressed_content = compress_string(content)
+            payload = (content, compressed_content)
+            cache.set(key, payload, settings.CATALOG_CACHE_TIMEOUT)
+        content, compressed_content = payload
+        response = HttpResponse(content, content_type='application/json')
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if compressed_content and re_accepts_gzip.search(
+                request.META.get('HTTP_ACCEPT_ENCODING', '')
+        ):
+            response.content = compressed_content
+            response['Content-Encoding'] = 'gzip'
+        return response
+
+
+class StreamingListMixin(RowRenderMixin):
+    def list(self, request, *args, **kwargs):
+        if (self.paginator is not None
+                or request.accepted_media_type != 'application/json'):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self.render_rows(queryset.using(queryset.db)),
+            content_type='application/json'
+        )
+
+
+def invalidate_catalog(catalog_name):
+    cache.delete(CATALOG_CACHE_KEY.format(catalog_name))
+
+
+class ReplicaReadMixin:
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        use_replica(
+            request.method in SAFE_METHODS
+            and replica_configured()
+            and not is_pinned_to_primary(request.user)
+        )
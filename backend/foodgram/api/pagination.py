@@ -1,6 +1,80 @@
-from rest_framework.pagination import PageNumberPagination
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    Cursor, CursorPagination, PageNumberPagination
+)
 
 
 class CustomPagination(PageNumberPagination):
     page_size_query_param = 'limit'
     page_size = 6
+    max_page_size = 100
+
+
+class TrendingPagination(CursorPagination):
+    page_size_query_param = 'limit'
+    page_size = 6
+    max_page_size = 100
+    ordering = ('-trending_score', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is not None and self.cursor.position is None:
+            self.cursor = None
+        reverse = self.cursor is not None and self.cursor.reverse
+        if self.cursor is None:
+            queryset = queryset.order_by(*self.ordering)
+        else:
+            queryset = self.filter_position(queryset, self.cursor)
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+        return self.page
+
+    def filter_position(self, queryset, cursor):
+        try:
+            score, pk = cursor.position.split(':')
+            score, pk = float(score), int(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if cursor.reverse:
+            return queryset.filter(
+                Q(trending_score__gt=score)
+                | Q(trending_score=score, id__gt=pk)
+            ).order_by('trending_score', 'id')
+        return queryset.filter(
+            Q(trending_score__lt=score)
+            | Q(trending_score=score, id__lt=pk)
+        ).order_by(*self.ordering)
+
+    def get_position(self, recipe):
+        return f'{recipe.trending_score!r}:{recipe.id}'
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(Cursor(
+            offset=0, reverse=False, position=self.get_position(self.page[-1])
+        ))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return self.encode_cursor(Cursor(
+                offset=0, reverse=False, position=None
+            ))
+        return self.encode_cursor(Cursor(
+            offset=0, reverse=True, position=self.get_position(self.page[0])
+        ))
@@ -8,7 +8,7 @@ class AuthorOrAdminOrReadOnly(BasePermission):
                 or request.user.is_staff)
 
     def has_object_permission(self, request, view, obj):
-        return (obj.author == request.user
+        return (obj.author_id == request.user.id
                 or request.method in SAFE_METHODS
                 or request.user.is_staff
                 )
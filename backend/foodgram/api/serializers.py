@@ -4,28 +4,30 @@ from django.core.files.base import ContentFile
 from django.shortcuts import get_object_or_404
 from rest_framework.serializers import (
     CharField,
+    DecimalField,
     ImageField,
     ModelSerializer,
+    Serializer,
     SerializerMethodField,
     ValidationError
 )
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
 from recipes.models import (
-    Basket,
-    Favorites,
     Ingredient,
     IngredientRecipe,
     Recipe,
     Tag
 )
+from recipes.nutrition import update_recipe_totals
+from users.relations import get_relations
 from users.serializers import CustomUserSerializer
 
 
 class IngredientSerializer(ModelSerializer):
     class Meta:
         model = Ingredient
-        fields = '__all__'
+        fields = ('id', 'name', 'measurement_unit')
 
 
 class TagSerializer(ModelSerializer):
@@ -61,12 +63,25 @@ class ShortRecipeSerializer(ModelSerializer):
         fields = ('id', 'name', 'image', 'cooking_time')
 
 
-class RecipeSerializer(ModelSerializer):
+class RecipeMatchSerializer(ShortRecipeSerializer):
+    coverage = SerializerMethodField()
+    missing_count = SerializerMethodField()
+
+    class Meta(ShortRecipeSerializer.Meta):
+        fields = ShortRecipeSerializer.Meta.fields + (
+            'coverage',
+            'missing_count'
+        )
+
+    def get_coverage(self, obj):
+        return round(self.context['matches'][obj.id][0], 2)
+
+    def get_missing_count(self, obj):
+        return self.context['matches'][obj.id][1]
+
+
+class RecipeCompactSerializer(ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
-    ingredients = IngredientRecipeSerializer(
-        many=True,
-        read_only=True
-    )
     author = CustomUserSerializer(read_only=True)
     is_favorited = SerializerMethodField()
     is_in_shopping_cart = SerializerMethodField()
@@ -74,6 +89,34 @@ class RecipeSerializer(ModelSerializer):
 
     class Meta:
         model = Recipe
+        fields = (
+            'id',
+            'tags',
+            'author',
+            'name',
+            'image',
+            'cooking_time',
+            'calories',
+            'cost',
+            'is_favorited',
+            'is_in_shopping_cart'
+        )
+        read_only_fields = ('calories', 'cost')
+
+    def get_is_favorited(self, obj):
+        return obj.id in get_relations(self.context.get('request')).favorites
+
+    def get_is_in_shopping_cart(self, obj):
+        return obj.id in get_relations(self.context.get('request')).baskets
+
+
+class RecipeSerializer(RecipeCompactSerializer):
+    ingredients = IngredientRecipeSerializer(
+        many=True,
+        read_only=True
+    )
+
+    class Meta(RecipeCompactSerializer.Meta):
         fields = (
             'id',
             'tags',
@@ -83,6 +126,8 @@ class RecipeSerializer(ModelSerializer):
             'image',
             'text',
             'cooking_time',
+            'calories',
+            'cost',
             'is_favorited',
             'is_in_shopping_cart'
         )
@@ -103,7 +148,7 @@ class RecipeSerializer(ModelSerializer):
         )
         recipe = Recipe.objects.create(**validated_data)
         recipe.tags.set(tags)
-        return self.add_ingredients(recipe, ingredients)
+        return self.update_totals(self.add_ingredients(recipe, ingredients))
 
     def update(self, instance, validated_data):
         super().update(instance, validated_data)
@@ -116,25 +161,12 @@ class RecipeSerializer(ModelSerializer):
         instance.ingredients.clear()
         instance = self.add_ingredients(instance, ingredients)
         instance.save()
-        return instance
+        return self.update_totals(instance)
 
-    def get_is_favorited(self, obj):
-        request = self.context.get('request')
-        if request.user.is_anonymous:
-            return False
-        return Favorites.objects.filter(
-            user=request.user,
-            recipe=obj
-        ).exists()
-
-    def get_is_in_shopping_cart(self, obj):
-        request = self.context.get('request')
-        if request.user.is_anonymous:
-            return False
-        return Basket.objects.filter(
-            user=request.user,
-            recipe=obj
-        ).exists()
+    def update_totals(self, instance):
+        update_recipe_totals(Recipe.objects.filter(pk=instance.pk))
+        instance.refresh_from_db(fields=('calories', 'cost'))
+        return instance
 
     def validate_ingredients(self, value):
         if len(value) == 0:
@@ -169,3 +201,22 @@ class RecipeSerializer(ModelSerializer):
                 code=HTTP_400_BAD_REQUEST
             )
         return value
+
+
+class RecipeDetailSerializer(RecipeSerializer):
+    similar = SerializerMethodField()
+
+    class Meta(RecipeSerializer.Meta):
+        fields = RecipeSerializer.Meta.fields + ('similar',)
+
+    def get_similar(self, obj):
+        return ShortRecipeSerializer(
+            [item.similar for item in obj.similar.all()],
+            many=True,
+            context=self.context
+        ).data
+
+
+class BasketTotalsSerializer(Serializer):
+    calories = DecimalField(max_digits=12, decimal_places=3)
+    cost = DecimalField(max_digits=12, decimal_places=3)
@@ -0,0 +1,46 @@
+import json
+
+from django.test import TestCase
+
+from recipes.catalog import CatalogImporter
+from recipes.models import Ingredient, Recipe
+from users.models import User
+
+
+class CatalogImportTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            username='author',
+            email='author@example.com',
+            password='password'
+        )
+        Ingredient.objects.create(name='Мука', measurement_unit='г')
+
+    def line(self, **fields):
+        data = {
+            'name': 'Блины',
+            'text': 'Описание',
+            'cooking_time': 10,
+            'ingredients': [{'name': 'Мука', 'amount': 100}]
+        }
+        data.update(fields)
+        return json.dumps(data, ensure_ascii=False).encode()
+
+    def test_bad_rows_do_not_reject_the_batch(self):
+        created, errors = CatalogImporter(self.author).run([
+            self.line(),
+            b'\xff\xfe',
+            self.line(name='Б' * 201),
+            self.line(cooking_time=0),
+            self.line(ingredients=[{'name': 'Мука', 'amount': 0}]),
+            self.line(name='Оладьи')
+        ])
+        self.assertEqual(len(created), 2)
+        self.assertEqual(
+            [error['line'] for error in errors],
+            [2, 3, 4, 5]
+        )
+        self.assertEqual(
+            set(Recipe.objects.values_list('name', flat=True)),
+            {'Блины', 'Оладьи'}
+        )
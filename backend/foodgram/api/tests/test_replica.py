@@ -0,0 +1,118 @@
+import os
+from tempfile import TemporaryDirectory
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api.checks import check_replica_cache
+from recipes.models import Ingredient, Recipe
+from users.models import User
+
+
+REPLICA = settings.REPLICA_DATABASE
+
+
+class ReplicaRoutingTests(TestCase):
+    databases = {'default', REPLICA}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.replica_dir = TemporaryDirectory()
+        connections.databases[REPLICA] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.path.join(cls.replica_dir.name, 'replica.sqlite3')
+        }
+        connections.ensure_defaults(REPLICA)
+        connections.prepare_test_settings(REPLICA)
+        call_command(
+            'migrate',
+            database=REPLICA,
+            interactive=False,
+            verbosity=0
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.databases[REPLICA]
+        cls.replica_dir.cleanup()
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(
+            username='author',
+            email='author@example.com',
+            password='password'
+        )
+        self.reader = User.objects.create_user(
+            username='reader',
+            email='reader@example.com',
+            password='password'
+        )
+        self.recipe = Recipe.objects.create(
+            name='Рецепт',
+            text='Описание',
+            image='recipes/images/recipe.jpg',
+            author=self.author,
+            cooking_time=10
+        )
+        self.url = f'/api/recipes/{self.recipe.id}/'
+
+    def client_for(self, user=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+        return client
+
+    def test_safe_requests_read_from_replica(self):
+        client = self.client_for()
+        self.assertEqual(client.get('/api/recipes/').data['count'], 0)
+        self.assertEqual(client.get(self.url).status_code, 404)
+
+    def test_author_reads_own_write_from_primary(self):
+        client = self.client_for(self.author)
+        self.assertEqual(client.get(self.url).status_code, 404)
+        response = client.post(f'{self.url}favorite/')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(client.get(self.url).status_code, 200)
+        self.assertEqual(
+            self.client_for(self.reader).get(self.url).status_code,
+            404
+        )
+
+    def test_pin_expires(self):
+        client = self.client_for(self.author)
+        client.post(f'{self.url}favorite/')
+        cache.clear()
+        self.assertEqual(client.get(self.url).status_code, 404)
+
+    def test_catalog_cache_is_built_from_primary(self):
+        Ingredient.objects.create(name='Мука', measurement_unit='г')
+        response = self.client_for().get('/api/ingredients/')
+        self.assertEqual(
+            [row['name'] for row in response.json()],
+            ['Мука']
+        )
+
+    def test_routing_is_reset_after_request(self):
+        self.client_for().get('/api/recipes/')
+        self.assertEqual(Recipe.objects.all().db, 'default')
+
+    def test_process_local_cache_is_rejected(self):
+        with override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+        }}):
+            errors = check_replica_cache(None)
+        self.assertEqual([error.id for error in errors], ['api.E001'])
+        with override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.MemcachedCache',
+            'LOCATION': 'memcached:11211'
+        }}):
+            self.assertEqual(check_replica_cache(None), [])
@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from recipes.models import Recipe
+from users.models import User, UserStats
+
+
+class UserStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(
+            username='author',
+            email='author@example.com',
+            password='password'
+        )
+        Recipe.objects.create(
+            name='Рецепт',
+            text='Описание',
+            image='recipes/images/recipe.jpg',
+            author=self.author,
+            cooking_time=10
+        )
+        UserStats.objects.all().delete()
+
+    def test_missing_stats_are_counted(self):
+        response = APIClient().get(f'/api/users/{self.author.id}/stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['recipes_count'], 1)
+        self.assertEqual(
+            UserStats.objects.get(user=self.author).recipes_count,
+            1
+        )
+
+    def test_unknown_user(self):
+        response = APIClient().get('/api/users/0/stats/')
+        self.assertEqual(response.status_code, 404)
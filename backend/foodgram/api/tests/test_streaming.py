@@ -0,0 +1,65 @@
+import json
+import tracemalloc
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from recipes.models import Ingredient
+
+
+@override_settings(STREAM_CHUNK_SIZE=100)
+class StreamingListTests(TestCase):
+    rows = 500
+
+    @classmethod
+    def setUpTestData(cls):
+        Ingredient.objects.bulk_create(
+            [
+                Ingredient(name=f'Мука {number}', measurement_unit='г')
+                for number in range(cls.rows)
+            ] + [
+                Ingredient(name=f'Масло {number}', measurement_unit='г')
+                for number in range(cls.rows * 9)
+            ],
+            batch_size=400
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def stream(self, prefix):
+        response = self.client.get('/api/ingredients/', {'name': prefix})
+        self.assertTrue(response.streaming)
+        return response
+
+    def peak_memory(self, prefix):
+        response = self.stream(prefix)
+        tracemalloc.start()
+        try:
+            chunks = sum(1 for _ in response.streaming_content)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            response.close()
+        return chunks, peak
+
+    def test_stream_is_valid_json(self):
+        response = self.stream('Мука')
+        data = json.loads(b''.join(response.streaming_content))
+        response.close()
+        self.assertEqual(len(data), self.rows)
+
+    def test_memory_does_not_grow_with_rows(self):
+        small_chunks, small_peak = self.peak_memory('Мука')
+        large_chunks, large_peak = self.peak_memory('М')
+        self.assertEqual(small_chunks, self.rows + 1)
+        self.assertEqual(large_chunks, self.rows * 10 + 1)
+        self.assertLess(large_peak, small_peak * 2)
+
+    def test_cached_catalog_renders_all_rows(self):
+        for _ in range(2):
+            response = self.client.get('/api/ingredients/')
+            self.assertFalse(response.streaming)
+            self.assertEqual(len(response.json()), self.rows * 10)
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.throttling import AnonTokenBucketThrottle
+
+
+@patch.dict(AnonTokenBucketThrottle.THROTTLE_RATES, {'anon': '2/min'})
+class AnonThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient(REMOTE_ADDR='172.18.0.5')
+
+    def get(self, address):
+        return self.client.get(
+            '/api/tags/',
+            HTTP_X_FORWARDED_FOR=address
+        ).status_code
+
+    def test_clients_behind_proxy_have_separate_buckets(self):
+        self.assertEqual(
+            [self.get('10.0.0.1') for _ in range(3)],
+            [200, 200, 429]
+        )
+        self.assertEqual(self.get('10.0.0.2'), 200)
+
+    def test_forwarded_address_cannot_be_spoofed(self):
+        for _ in range(2):
+            self.get('10.0.0.1')
+        self.assertEqual(self.get('192.168.1.1, 10.0.0.1'), 429)
@@ -0,0 +1,43 @@
+from rest_framework.throttling import (
+    AnonRateThrottle,
+    ScopedRateThrottle,
+    SimpleRateThrottle,
+    UserRateThrottle
+)
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        self.now = self.timer()
+        tokens, updated = self.cache.get(
+            self.key,
+            (self.num_requests, self.now)
+        )
+        self.tokens = min(
+            self.num_requests,
+            tokens + (self.now - updated) * self.num_requests / self.duration
+        )
+        if self.tokens < 1:
+            return False
+        self.cache.set(self.key, (self.tokens - 1, self.now), self.duration)
+        return True
+
+    def wait(self):
+        return (1 - self.tokens) * self.duration / self.num_requests
+
+
+class AnonTokenBucketThrottle(AnonRateThrottle, TokenBucketThrottle):
+    pass
+
+
+class UserTokenBucketThrottle(UserRateThrottle, TokenBucketThrottle):
+    pass
+
+
+class ScopedTokenBucketThrottle(ScopedRateThrottle, TokenBucketThrottle):
+    pass
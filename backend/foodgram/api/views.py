@@ -1,35 +1,67 @@
-from django.db.models import Sum
-from django.http import HttpResponse
+from itertools import chain
+
+from django.conf import settings
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
     HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST
 )
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 
+from events.broker import publish
+from jobs.queue import enqueue
+from jobs.serializers import JobSerializer
 from .filters import IngredientSearchFilter, RecipeFilter
+from .mixins import (
+    CachedCatalogMixin,
+    ReplicaReadMixin,
+    StreamingListMixin
+)
+from .pagination import TrendingPagination
 from .permissions import AuthorOrAdminOrReadOnly, IsAuthenticatedOrAdmin
+from recipes.catalog import CatalogImporter, export_recipes
+from recipes.index import get_recipe_index
+from recipes.matching import match_recipes
 from recipes.models import (
     Basket,
     Favorites,
     Ingredient,
-    IngredientRecipe,
     Recipe,
+    SimilarRecipe,
     Tag
 )
+from recipes.nutrition import basket_totals
+from recipes.planner import plan_meals
+from recipes.shopping import basket_ingredients, shopping_list_lines
 from .serializers import (
+    BasketTotalsSerializer,
     IngredientSerializer,
+    RecipeCompactSerializer,
+    RecipeDetailSerializer,
+    RecipeMatchSerializer,
     RecipeSerializer,
     ShortRecipeSerializer,
     TagSerializer
 )
 
 
-class IngredientViewSet(ReadOnlyModelViewSet):
+COMPACT_VIEW = 'compact'
+TRENDING_ORDERING = 'trending'
+
+
+class IngredientViewSet(ReplicaReadMixin,
+                        CachedCatalogMixin,
+                        StreamingListMixin,
+                        ReadOnlyModelViewSet):
+    catalog_name = 'ingredients'
     queryset = Ingredient.objects.all()
     serializer_class = IngredientSerializer
     pagination_class = None
@@ -37,51 +69,193 @@ class IngredientViewSet(ReadOnlyModelViewSet):
     search_fields = ('^name',)
 
 
-class TagViewSet(ReadOnlyModelViewSet):
+class TagViewSet(ReplicaReadMixin,
+                 CachedCatalogMixin,
+                 StreamingListMixin,
+                 ReadOnlyModelViewSet):
+    catalog_name = 'tags'
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     pagination_class = None
 
 
-class RecipeViewSet(ModelViewSet):
+class RecipeViewSet(ReplicaReadMixin, ModelViewSet):
     queryset = Recipe.objects.all()
     serializer_class = RecipeSerializer
     permission_classes = (AuthorOrAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend,)
     filterset_class = RecipeFilter
+    throttle_scope = None
+
+    def get_throttles(self):
+        if self.action in ('create', 'update', 'partial_update'):
+            self.throttle_scope = 'recipe_write'
+        return super().get_throttles()
+
+    def is_compact_view(self):
+        return (self.action == 'list'
+                and self.request.query_params.get('view') == COMPACT_VIEW)
+
+    def is_trending_ordering(self):
+        return (self.action == 'list'
+                and self.request.query_params.get('ordering')
+                == TRENDING_ORDERING)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.is_trending_ordering():
+                self._paginator = TrendingPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def get_queryset(self):
+        queryset = Recipe.objects.select_related(
+            'author'
+        ).prefetch_related('tags')
+        if self.is_compact_view():
+            return queryset.defer('text')
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(Prefetch(
+                'similar',
+                queryset=SimilarRecipe.objects.select_related('similar')
+            ))
+        return queryset.prefetch_related('ingredients__ingredient')
+
+    def get_serializer_class(self):
+        if self.is_compact_view():
+            return RecipeCompactSerializer
+        if self.action == 'retrieve':
+            return RecipeDetailSerializer
+        return RecipeSerializer
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user)
+        recipe = serializer.save(author=self.request.user)
+        enqueue('recipes.update_similar', recipe_id=recipe.id)
 
-    @action(detail=False, permission_classes=(IsAuthenticatedOrAdmin,))
+    def perform_update(self, serializer):
+        recipe = serializer.save()
+        enqueue('recipes.update_similar', recipe_id=recipe.id)
+
+    @action(detail=False,
+            permission_classes=(IsAuthenticatedOrAdmin,),
+            throttle_scope='shopping_list'
+            )
     def download_shopping_cart(self, request):
-        if not Basket.objects.filter(
-                user=request.user
-        ).exists():
+        if request.query_params.get('background'):
+            job = enqueue(
+                'recipes.shopping_list',
+                user=request.user,
+                user_id=request.user.id
+            )
+            return Response(JobSerializer(job).data, status=HTTP_202_ACCEPTED)
+        ingredients = basket_ingredients(request.user).iterator()
+        first = next(ingredients, None)
+        if first is None:
             return Response(
                 {'errors': 'В корзине нет рецептов'},
                 status=HTTP_400_BAD_REQUEST
             )
-        ingredients = IngredientRecipe.objects.filter(
-            recipes__baskets__user=request.user
-        ).values(
-            'ingredient__name',
-            'ingredient__measurement_unit'
-        ).annotate(amount=Sum('amount'))
-        shopping_list = ''
-        for ingredient in ingredients:
-            item = (f'* {ingredient["ingredient__name"]} '
-                    f'({ingredient["ingredient__measurement_unit"]}) -- '
-                    f'{ingredient["amount"]}\n\n'
-                    )
-            shopping_list += item
-        return HttpResponse(shopping_list,
-                            content_type='text/plain;charset=UTF-8'
-                            )
+        return StreamingHttpResponse(
+            shopping_list_lines(chain((first,), ingredients)),
+            content_type='text/plain;charset=UTF-8'
+        )
+
+    @action(detail=False, permission_classes=(IsAdminUser,))
+    def export(self, request):
+        return StreamingHttpResponse(
+            export_recipes(),
+            content_type='application/x-ndjson;charset=UTF-8'
+        )
+
+    @action(methods=['post'],
+            detail=False,
+            url_path='import',
+            permission_classes=(IsAdminUser,)
+            )
+    def import_recipes(self, request):
+        created, errors = CatalogImporter(request.user).run(
+            request.stream or ()
+        )
+        return Response(
+            {'created': len(created), 'errors': errors},
+            status=HTTP_201_CREATED if created else HTTP_400_BAD_REQUEST
+        )
+
+    @action(detail=False, permission_classes=(IsAuthenticatedOrAdmin,))
+    def shopping_cart_totals(self, request):
+        return Response(
+            BasketTotalsSerializer(basket_totals(request.user)).data
+        )
+
+    @action(detail=False)
+    def meal_plan(self, request):
+        try:
+            meals = int(request.query_params.get('meals', 1))
+            pantry = [int(ingredient_id) for ingredient_id
+                      in request.query_params.getlist('pantry')]
+        except ValueError:
+            return Response(
+                {'errors': 'Некорректные параметры запроса'},
+                status=HTTP_400_BAD_REQUEST
+            )
+        if not 1 <= meals <= settings.MEAL_PLAN_MAX_MEALS:
+            return Response(
+                {'errors': ('Количество блюд должно быть от 1 до '
+                            f'{settings.MEAL_PLAN_MAX_MEALS}')},
+                status=HTTP_400_BAD_REQUEST
+            )
+        plan, ingredient_ids = plan_meals(
+            get_recipe_index(),
+            meals,
+            tags=request.query_params.getlist('tags'),
+            pantry=pantry
+        )
+        recipes = Recipe.objects.in_bulk(plan)
+        return Response({
+            'recipes': ShortRecipeSerializer(
+                [recipes[pk] for pk in plan if pk in recipes],
+                many=True,
+                context={'request': request}
+            ).data,
+            'ingredients': IngredientSerializer(
+                Ingredient.objects.filter(id__in=ingredient_ids),
+                many=True
+            ).data
+        })
+
+    @action(detail=False)
+    def match(self, request):
+        try:
+            ingredient_ids = [int(ingredient_id) for ingredient_id
+                              in request.query_params.getlist('ingredients')]
+        except ValueError:
+            return Response(
+                {'errors': 'Некорректные параметры запроса'},
+                status=HTTP_400_BAD_REQUEST
+            )
+        ranking = match_recipes(get_recipe_index(), ingredient_ids)
+        page = self.paginate_queryset(ranking)
+        recipes = Recipe.objects.in_bulk(
+            [recipe_id for _, _, recipe_id in page]
+        )
+        serializer = RecipeMatchSerializer(
+            [recipes[recipe_id] for _, _, recipe_id in page
+             if recipe_id in recipes],
+            many=True,
+            context={
+                'request': request,
+                'matches': {recipe_id: (coverage, missing_count)
+                            for coverage, missing_count, recipe_id in page}
+            }
+        )
+        return self.get_paginated_response(serializer.data)
 
     @action(methods=['post', 'delete'],
             detail=True,
-            permission_classes=(IsAuthenticatedOrAdmin,)
+            permission_classes=(IsAuthenticatedOrAdmin,),
+            throttle_scope='toggle'
             )
     def shopping_cart(self, request, pk):
         recipe = get_object_or_404(Recipe, id=pk)
@@ -100,6 +274,12 @@ class RecipeViewSet(ModelViewSet):
                 user=request.user,
                 recipe=recipe
             )
+            publish(
+                request.user.id,
+                'shopping_cart',
+                recipe=recipe.id,
+                active=True
+            )
             return Response(serializer.data, status=HTTP_201_CREATED)
         if not basket_filter.exists():
             return Response(
@@ -107,11 +287,18 @@ class RecipeViewSet(ModelViewSet):
                 status=HTTP_400_BAD_REQUEST
             )
         basket_filter.delete()
+        publish(
+            request.user.id,
+            'shopping_cart',
+            recipe=recipe.id,
+            active=False
+        )
         return Response(status=HTTP_204_NO_CONTENT)
 
     @action(methods=['post', 'delete'],
             detail=True,
-            permission_classes=(IsAuthenticatedOrAdmin,)
+            permission_classes=(IsAuthenticatedOrAdmin,),
+            throttle_scope='toggle'
             )
     def favorite(self, request, pk):
         recipe = get_object_or_404(Recipe, id=pk)
@@ -130,6 +317,12 @@ class RecipeViewSet(ModelViewSet):
                 user=request.user,
                 recipe=recipe
             )
+            publish(
+                request.user.id,
+                'favorite',
+                recipe=recipe.id,
+                active=True
+            )
             return Response(serializer.data, status=HTTP_201_CREATED)
         if not favorites_filter.exists():
             return Response(
@@ -137,4 +330,10 @@ class RecipeViewSet(ModelViewSet):
                 status=HTTP_400_BAD_REQUEST
             )
         favorites_filter.delete()
+        publish(
+            request.user.id,
+            'favorite',
+            recipe=recipe.id,
+            active=False
+        )
         return Response(status=HTTP_204_NO_CONTENT)
@@ -0,0 +1,70 @@
+"""Compare ingredient matching in SQL with the in-memory recipe index.
+
+The baseline ranks recipes with one annotate(Count(filter=...)) query,
+the way the endpoint would without the index; match_recipes counts hits
+over the index posting lists. Both must agree on the first page.
+Run from backend/foodgram after makemigrations:
+python -m benchmarks.matching [--recipes N] [--ingredients K]
+"""
+from argparse import ArgumentParser
+
+from .utils import best_of, create_recipes, setup, test_database
+
+
+PAGE_SIZE = 6
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--recipes', type=int, default=5000)
+    parser.add_argument('--ingredients', type=int, default=8)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+    setup()
+
+    from django.db.models import Count, F, FloatField, Q
+    from django.db.models.functions import Cast
+
+    from recipes.index import RecipeIndex
+    from recipes.matching import match_recipes
+    from recipes.models import Ingredient, Recipe
+
+    def naive(ingredient_ids):
+        return list(Recipe.objects.annotate(
+            matched=Count(
+                'ingredients',
+                filter=Q(ingredients__ingredient__in=ingredient_ids)
+            ),
+            total=Count('ingredients')
+        ).filter(matched__gt=0).annotate(
+            coverage=Cast('matched', FloatField()) / F('total'),
+            missing=F('total') - F('matched')
+        ).order_by(
+            '-coverage', 'missing', '-id'
+        ).values_list('id', flat=True)[:PAGE_SIZE])
+
+    with test_database():
+        create_recipes(args.recipes)
+        ingredient_ids = list(Ingredient.objects.values_list(
+            'id', flat=True
+        ).order_by('id')[::100 // args.ingredients][:args.ingredients])
+        index = RecipeIndex.build()
+
+        def indexed():
+            return [
+                recipe_id for _, _, recipe_id
+                in match_recipes(index, ingredient_ids)[:PAGE_SIZE]
+            ]
+
+        if naive(ingredient_ids) != indexed():
+            raise SystemExit('SQL and index rankings differ')
+        print(f'{args.recipes} recipes, {len(ingredient_ids)} ingredients')
+        sql_time = best_of(lambda: naive(ingredient_ids), args.number)
+        index_time = best_of(indexed, args.number)
+        print(f'sql: {sql_time * 1000:.2f} ms, '
+              f'index: {index_time * 1000:.2f} ms '
+              f'(x{sql_time / index_time:.0f})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Compare DRF's JSON renderer and parser with the orjson-based ones.
+
+Run from backend/foodgram after makemigrations:
+python -m benchmarks.renderers [--recipes N]
+"""
+from argparse import ArgumentParser
+from io import BytesIO
+
+from .utils import best_of, create_recipes, setup, test_database
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--recipes', type=int, default=100)
+    parser.add_argument('--number', type=int, default=50)
+    args = parser.parse_args()
+    setup()
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from api.parsers import FastJSONParser
+    from api.renderers import FastJSONRenderer
+    from api.serializers import RecipeSerializer
+    from recipes.models import Recipe
+
+    with test_database():
+        author = create_recipes(args.recipes)
+        request = Request(APIRequestFactory().get(
+            '/api/recipes/',
+            HTTP_HOST='localhost'
+        ))
+        request.user = author
+        data = RecipeSerializer(
+            Recipe.objects.select_related('author').prefetch_related(
+                'tags',
+                'ingredients__ingredient'
+            ),
+            many=True,
+            context={'request': request}
+        ).data
+    content = JSONRenderer().render(data)
+    print(f'{args.recipes} recipes, {len(content)} bytes of JSON')
+    for name, slow, fast in (
+        (
+            'render',
+            lambda: JSONRenderer().render(data),
+            lambda: FastJSONRenderer().render(data)
+        ),
+        (
+            'parse',
+            lambda: JSONParser().parse(BytesIO(content)),
+            lambda: FastJSONParser().parse(BytesIO(content))
+        ),
+    ):
+        slow_time = best_of(slow, args.number)
+        fast_time = best_of(fast, args.number)
+        print(f'{name}: {slow_time * 1000:.2f} ms -> '
+              f'{fast_time * 1000:.2f} ms (x{slow_time / fast_time:.1f})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""Measure cold start: imports, URLconf and time to the first response.
+
+Every run starts a fresh interpreter. With --gunicorn the script also
+starts gunicorn with and without preload_app and reports the time to
+the first 200 and the total proportional memory (Linux only).
+Run from backend/foodgram:
+python -m benchmarks.startup [--runs N] [--gunicorn]
+"""
+import json
+import os
+import signal
+import subprocess
+import sys
+from argparse import ArgumentParser
+from collections import Counter
+from statistics import median
+from time import perf_counter, sleep
+from urllib.request import Request, urlopen
+
+
+URL = '/admin/login/'
+BIND = '127.0.0.1:8765'
+COLD_START = f'''
+import json
+from time import perf_counter
+start = perf_counter()
+import foodgram.wsgi
+imported = perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+resolved = perf_counter()
+from django.test import Client
+Client().get({URL!r}, HTTP_HOST='localhost')
+responded = perf_counter()
+print(json.dumps({{
+    'wsgi': imported - start,
+    'urls': resolved - imported,
+    'first response': responded - start
+}}))
+'''
+
+
+def cold_starts(runs):
+    results = [
+        json.loads(subprocess.run(
+            [sys.executable, '-c', COLD_START],
+            capture_output=True,
+            check=True,
+            text=True
+        ).stdout)
+        for _ in range(runs)
+    ]
+    for name in results[0]:
+        timing = median(result[name] for result in results)
+        print(f'{name}: {timing * 1000:.0f} ms')
+
+
+def import_profile(top):
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import foodgram.wsgi'],
+        capture_output=True,
+        check=True,
+        text=True
+    ).stderr
+    packages = Counter()
+    for line in stderr.splitlines()[1:]:
+        if not line.startswith('import time:'):
+            continue
+        own, _, module = line[len('import time:'):].split('|')
+        packages[module.strip().split('.')[0]] += int(own)
+    print(f'import time by package, top {top}:')
+    for package, microseconds in packages.most_common(top):
+        print(f'  {package}: {microseconds / 1000:.0f} ms')
+
+
+def get(path):
+    request = Request(f'http://{BIND}{path}', headers={'Host': 'localhost'})
+    with urlopen(request, timeout=5) as response:
+        response.read()
+
+
+def proportional_memory(pid):
+    with open(f'/proc/{pid}/smaps_rollup') as smaps:
+        for line in smaps:
+            if line.startswith('Pss:'):
+                return int(line.split()[1]) // 1024
+    return 0
+
+
+def gunicorn(preload, workers):
+    env = dict(
+        os.environ,
+        GUNICORN_PRELOAD=str(preload),
+        GUNICORN_WORKERS=str(workers)
+    )
+    start = perf_counter()
+    server = subprocess.Popen(
+        [
+            'gunicorn', 'foodgram.wsgi:application',
+            '--config', 'gunicorn.conf.py',
+            '--bind', BIND,
+            '--log-level', 'warning'
+        ],
+        env=env
+    )
+    try:
+        while True:
+            try:
+                get(URL)
+                break
+            except OSError:
+                sleep(0.01)
+        ready = perf_counter() - start
+        sleep(2)
+        pids = [server.pid] + [
+            int(pid) for pid in subprocess.run(
+                ['pgrep', '-P', str(server.pid)],
+                capture_output=True,
+                text=True
+            ).stdout.split()
+        ]
+        memory = sum(proportional_memory(pid) for pid in pids)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(10)
+    print(f'preload={preload}: first 200 after {ready * 1000:.0f} ms, '
+          f'{memory} MB PSS for master and {workers} workers')
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--gunicorn', action='store_true')
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'foodgram.settings')
+    cold_starts(args.runs)
+    import_profile(args.top)
+    if args.gunicorn:
+        for preload in (False, True):
+            gunicorn(preload, args.workers)
+
+
+if __name__ == '__main__':
+    main()
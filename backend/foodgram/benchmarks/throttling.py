@@ -0,0 +1,98 @@
+"""Measure the per-request cost of DRF's throttles and the token buckets.
+
+Each request runs the anon, user and scoped throttle against the
+configured default cache, at exactly the allowed rate. Point
+CACHE_BACKEND and CACHE_LOCATION at memcached to measure the setup used
+in production. Run from backend/foodgram:
+python -m benchmarks.throttling [--rate 600/min] [--number N]
+"""
+from argparse import ArgumentParser
+from itertools import count
+
+from .utils import best_of, setup
+
+
+class Clock:
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def throttles(classes, rate, clock):
+    rates = {'anon': rate, 'user': rate, 'toggle': rate}
+    result = []
+    for throttle_class in classes:
+        throttle = type(
+            throttle_class.__name__,
+            (throttle_class,),
+            {'THROTTLE_RATES': rates}
+        )()
+        throttle.timer = clock
+        result.append(throttle)
+    return result
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--rate', default='600/min')
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+    setup()
+
+    from django.conf import settings
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+    from rest_framework.throttling import (
+        AnonRateThrottle, ScopedRateThrottle, UserRateThrottle
+    )
+
+    from api.throttling import (
+        AnonTokenBucketThrottle,
+        ScopedTokenBucketThrottle,
+        UserTokenBucketThrottle
+    )
+    from users.models import User
+
+    class View:
+        throttle_scope = 'toggle'
+
+    num_requests, duration = AnonRateThrottle().parse_rate(args.rate)
+    print(f'cache: {settings.CACHES["default"]["BACKEND"]}, '
+          f'rate: {args.rate}')
+    clients = count(10 ** 9)
+    results = {}
+    for name, classes in (
+        ('drf', (AnonRateThrottle, UserRateThrottle, ScopedRateThrottle)),
+        ('token bucket', (
+            AnonTokenBucketThrottle,
+            UserTokenBucketThrottle,
+            ScopedTokenBucketThrottle
+        )),
+    ):
+        client = next(clients)
+        request = Request(APIRequestFactory().get(
+            '/api/recipes/',
+            REMOTE_ADDR=f'10.{client % 256}.{client // 256 % 256}.1'
+        ))
+        request.user = User(pk=client)
+        checks = throttles(
+            classes,
+            args.rate,
+            Clock(duration / num_requests)
+        )
+
+        def run():
+            for throttle in checks:
+                throttle.allow_request(request, View)
+
+        results[name] = best_of(run, args.number)
+        print(f'{name}: {results[name] * 1e6:.1f} us per request')
+    print(f'x{results["drf"] / results["token bucket"]:.1f}')
+
+
+if __name__ == '__main__':
+    main()
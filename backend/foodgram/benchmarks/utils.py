@@ -0,0 +1,68 @@
+import os
+from contextlib import contextmanager
+from timeit import repeat
+
+import django
+
+
+def setup():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'foodgram.settings')
+    django.setup()
+
+
+def best_of(func, number, rounds=5):
+    return min(repeat(func, number=number, repeat=rounds)) / number
+
+
+@contextmanager
+def test_database():
+    from django.db import connection
+    name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(name, verbosity=0)
+
+
+def create_recipes(count, ingredients_per_recipe=8):
+    from recipes.models import Ingredient, IngredientRecipe, Recipe, Tag
+    from users.models import User
+
+    author = User.objects.create_user(
+        username='benchmark',
+        email='benchmark@example.com',
+        password='benchmark'
+    )
+    Tag.objects.bulk_create([
+        Tag(
+            name=f'Тег {number}',
+            color=f'#0000{number:02}',
+            slug=f'tag{number}'
+        )
+        for number in range(3)
+    ])
+    tags = list(Tag.objects.all())
+    Ingredient.objects.bulk_create([
+        Ingredient(name=f'Ингредиент {number}', measurement_unit='г')
+        for number in range(100)
+    ])
+    IngredientRecipe.objects.bulk_create([
+        IngredientRecipe(ingredient_id=ingredient_id, amount=100)
+        for ingredient_id in Ingredient.objects.values_list('id', flat=True)
+    ])
+    rows = list(IngredientRecipe.objects.values_list('id', flat=True))
+    for number in range(count):
+        recipe = Recipe.objects.create(
+            name=f'Рецепт {number}',
+            text='Описание рецепта. ' * 20,
+            image='recipes/images/benchmark.jpg',
+            author=author,
+            cooking_time=30
+        )
+        recipe.tags.set([tags[number % len(tags)]])
+        recipe.ingredients.set([
+            rows[(number + offset) % len(rows)]
+            for offset in range(ingredients_per_recipe)
+        ])
+    return author
@@ -0,0 +1,114 @@
+import json
+from collections import defaultdict
+from functools import lru_cache
+from queue import Full, Queue
+from select import select
+from threading import Lock, Thread
+from time import sleep
+
+from django.conf import settings
+from django.db import DatabaseError, connection, connections, transaction
+from django.utils.module_loading import import_string
+
+
+class LocalBroker:
+    def __init__(self):
+        self.subscribers = defaultdict(set)
+        self.streams = 0
+        self.lock = Lock()
+
+    def subscribe(self, user_id):
+        queue = Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        with self.lock:
+            if (self.streams >= settings.EVENTS_MAX_STREAMS
+                    or len(self.subscribers.get(user_id, ()))
+                    >= settings.EVENTS_MAX_USER_STREAMS):
+                return None
+            self.subscribers[user_id].add(queue)
+            self.streams += 1
+        return queue
+
+    def unsubscribe(self, user_id, queue):
+        with self.lock:
+            queues = self.subscribers.get(user_id, set())
+            if queue not in queues:
+                return
+            queues.discard(queue)
+            self.streams -= 1
+            if not queues:
+                del self.subscribers[user_id]
+
+    def publish(self, user_id, event):
+        self.deliver(user_id, event)
+
+    def deliver(self, user_id, event):
+        with self.lock:
+            queues = list(self.subscribers.get(user_id, ()))
+        for queue in queues:
+            try:
+                queue.put_nowait(event)
+            except Full:
+                pass
+
+
+class PostgresBroker(LocalBroker):
+    channel = 'foodgram_events'
+
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+
+    def publish(self, user_id, event):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_notify(%s, %s)',
+                [self.channel, json.dumps({'user': user_id, 'event': event})]
+            )
+
+    def subscribe(self, user_id):
+        with self.lock:
+            if self.listener is None:
+                self.listener = Thread(target=self.listen, daemon=True)
+                self.listener.start()
+        return super().subscribe(user_id)
+
+    def listen(self):
+        while True:
+            try:
+                self.wait_for_notifies()
+            except DatabaseError:
+                connections['default'].close()
+                sleep(settings.EVENTS_RETRY)
+
+    def wait_for_notifies(self):
+        listener = connections['default']
+        listener.ensure_connection()
+        raw = listener.connection
+        with listener.wrap_database_errors:
+            with raw.cursor() as cursor:
+                cursor.execute(f'LISTEN {self.channel}')
+            while True:
+                if not select([raw], [], [], settings.EVENTS_KEEPALIVE)[0]:
+                    continue
+                raw.poll()
+                while raw.notifies:
+                    data = json.loads(raw.notifies.pop(0).payload)
+                    self.deliver(data['user'], data['event'])
+
+
+_lock = Lock()
+
+
+@lru_cache(maxsize=None)
+def load_broker(path):
+    return import_string(path)()
+
+
+def get_broker():
+    with _lock:
+        return load_broker(settings.EVENTS_BROKER)
+
+
+def publish(user_id, event_type, **data):
+    event = {'type': event_type, **data}
+    transaction.on_commit(lambda: get_broker().publish(user_id, event))
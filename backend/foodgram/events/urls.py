@@ -0,0 +1,10 @@
+from django.urls import path
+
+from .views import EventStreamView
+
+
+app_name = 'events'
+
+urlpatterns = [
+    path('events/', EventStreamView.as_view(), name='stream')
+]
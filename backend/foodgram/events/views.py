@@ -0,0 +1,53 @@
+import json
+from queue import Empty
+from time import monotonic
+
+from django.conf import settings
+from django.db import connections
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+
+from .broker import get_broker
+from api.permissions import IsAuthenticatedOrAdmin
+
+
+class EventStream:
+    def __init__(self, broker, user_id):
+        self.broker = broker
+        self.user_id = user_id
+        self.queue = broker.subscribe(user_id)
+
+    def __iter__(self):
+        connections.close_all()
+        if self.queue is None:
+            yield f'retry: {settings.EVENTS_BUSY_RETRY * 1000}\n\n'
+            return
+        yield f'retry: {settings.EVENTS_RETRY * 1000}\n\n'
+        deadline = monotonic() + settings.EVENTS_STREAM_TIMEOUT
+        while monotonic() < deadline:
+            try:
+                event = self.queue.get(timeout=settings.EVENTS_KEEPALIVE)
+            except Empty:
+                yield ': keepalive\n\n'
+                continue
+            yield f'event: {event["type"]}\ndata: {json.dumps(event)}\n\n'
+
+    def close(self):
+        if self.queue is not None:
+            self.broker.unsubscribe(self.user_id, self.queue)
+
+
+class EventStreamView(APIView):
+    permission_classes = (IsAuthenticatedOrAdmin,)
+
+    def perform_content_negotiation(self, request, force=False):
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request):
+        response = StreamingHttpResponse(
+            EventStream(get_broker(), request.user.id),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from rest_framework.permissions import SAFE_METHODS
+
+from .routers import pin_to_primary, replica_configured, use_replica
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request, response):
+        if response.get('Content-Type', '').startswith(
+                settings.GZIP_EXCLUDE_CONTENT_TYPES
+        ):
+            return response
+        if (not response.streaming
+                and len(response.content) < settings.GZIP_MIN_LENGTH):
+            return response
+        return super().process_response(request, response)
+
+
+class ReplicaMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_replica(False)
+        try:
+            response = self.get_response(request)
+        finally:
+            use_replica(False)
+        user = getattr(request, 'user', None)
+        if (request.method not in SAFE_METHODS and replica_configured()
+                and user is not None and user.is_authenticated):
+            pin_to_primary(user)
+        return response
@@ -0,0 +1,45 @@
+from threading import local
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+REPLICA_PIN_KEY = 'replica-pin:{}'
+
+_state = local()
+
+
+def use_replica(enabled):
+    _state.replica = enabled
+
+
+def replica_configured():
+    return settings.REPLICA_DATABASE in settings.DATABASES
+
+
+def pin_to_primary(user):
+    cache.set(
+        REPLICA_PIN_KEY.format(user.pk),
+        True,
+        settings.REPLICA_PIN_TIMEOUT
+    )
+
+
+def is_pinned_to_primary(user):
+    return user.is_authenticated and cache.get(
+        REPLICA_PIN_KEY.format(user.pk),
+        False
+    )
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if getattr(_state, 'replica', False):
+            return settings.REPLICA_DATABASE
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
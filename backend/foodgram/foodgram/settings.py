@@ -20,6 +20,8 @@ INSTALLED_APPS = [
     'recipes.apps.RecipesConfig',
     'users.apps.UsersConfig',
     'api.apps.ApiConfig',
+    'jobs.apps.JobsConfig',
+    'events.apps.EventsConfig',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -34,10 +36,12 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'foodgram.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'foodgram.middleware.ReplicaMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -73,6 +77,40 @@ DATABASES = {
     }
 }
 
+if os.getenv('DB_REPLICA_HOST') or os.getenv('DB_REPLICA_NAME'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.getenv(
+            'DB_REPLICA_NAME',
+            default=DATABASES['default']['NAME']
+        ),
+        'HOST': os.getenv(
+            'DB_REPLICA_HOST',
+            default=DATABASES['default']['HOST']
+        ),
+        'PORT': os.getenv(
+            'DB_REPLICA_PORT',
+            default=DATABASES['default']['PORT']
+        ),
+        'TEST': {'MIRROR': 'default'}
+    }
+
+DATABASE_ROUTERS = ['foodgram.routers.ReplicaRouter']
+
+REPLICA_DATABASE = 'replica'
+
+REPLICA_PIN_TIMEOUT = 10
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', default=''),
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -106,6 +144,53 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 AUTH_USER_MODEL = 'users.User'
 
+GZIP_MIN_LENGTH = 1024
+GZIP_EXCLUDE_CONTENT_TYPES = (
+    'image/',
+    'video/',
+    'audio/',
+    'application/gzip',
+    'application/zip',
+    'application/pdf',
+    'text/event-stream',
+)
+
+CATALOG_CACHE_TIMEOUT = 60 * 60
+
+STREAM_CHUNK_SIZE = 2000
+
+TRENDING_HALF_LIFE_DAYS = 7
+
+RECIPE_INDEX_TIMEOUT = 10 * 60
+RECIPE_INDEX_UPDATE_INTERVAL = 60
+
+MEAL_PLAN_MAX_MEALS = 21
+
+SIMILAR_RECIPES_COUNT = 6
+SIMILAR_RECIPES_MAX_POSTINGS = 5000
+
+JOBS_EAGER = os.getenv('JOBS_EAGER', default='False') == 'True'
+JOBS_MAX_ATTEMPTS = 3
+JOBS_RETRY_DELAY = 30
+JOBS_WORKER_THREADS = 4
+JOBS_POLL_INTERVAL = 1
+JOBS_HEARTBEAT_INTERVAL = 30
+JOBS_LEASE_TIMEOUT = 5 * 60
+
+EVENTS_BROKER = os.getenv(
+    'EVENTS_BROKER',
+    default=('events.broker.PostgresBroker'
+             if 'postgresql' in DATABASES['default']['ENGINE']
+             else 'events.broker.LocalBroker')
+)
+EVENTS_QUEUE_SIZE = 100
+EVENTS_KEEPALIVE = 15
+EVENTS_RETRY = 3
+EVENTS_BUSY_RETRY = 30
+EVENTS_MAX_STREAMS = int(os.getenv('EVENTS_MAX_STREAMS', default=8))
+EVENTS_MAX_USER_STREAMS = 3
+EVENTS_STREAM_TIMEOUT = 5 * 60
+
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -115,6 +200,28 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.TokenAuthentication',
     ],
     'DEFAULT_PAGINATION_CLASS': 'api.pagination.CustomPagination',
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'api.throttling.AnonTokenBucketThrottle',
+        'api.throttling.UserTokenBucketThrottle',
+        'api.throttling.ScopedTokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'anon': '120/min',
+        'user': '600/min',
+        'recipe_write': '20/min',
+        'toggle': '120/min',
+        'shopping_list': '10/min',
+    },
+    'NUM_PROXIES': 1,
 }
 
 DJOSER = {
@@ -8,7 +8,9 @@ from . import settings
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('api.urls')),
-    path('api/', include('users.urls'))
+    path('api/', include('users.urls')),
+    path('api/', include('jobs.urls')),
+    path('api/', include('events.urls'))
 ]
 
 if settings.DEBUG:
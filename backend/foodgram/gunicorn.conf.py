@@ -0,0 +1,31 @@
+import multiprocessing
+import os
+
+
+bind = '0:8000'
+workers = int(os.getenv(
+    'GUNICORN_WORKERS',
+    default=multiprocessing.cpu_count() * 2 + 1
+))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', default=16))
+preload_app = os.getenv('GUNICORN_PRELOAD', default='True') == 'True'
+
+
+def when_ready(server):
+    if preload_app:
+        from django.urls import get_resolver
+        get_resolver().url_patterns
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        from django.db import connections
+        connections.close_all()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from django.db import connections
+        for conn in connections.all():
+            conn.connection = None
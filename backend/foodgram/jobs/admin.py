@@ -0,0 +1,15 @@
+from django.contrib import admin
+from django.contrib.admin import ModelAdmin
+
+from .models import Job
+
+
+class JobAdmin(ModelAdmin):
+    list_display = (
+        'name', 'status', 'attempts', 'run_at', 'heartbeat', 'updated'
+    )
+    list_filter = ('status', 'name')
+    search_fields = ('name',)
+
+
+admin.site.register(Job, JobAdmin)
@@ -0,0 +1,117 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connection
+
+from jobs.queue import claim_job, heartbeat, run_job
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Запускает обработчик фоновых задач'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=settings.JOBS_WORKER_THREADS,
+            help='Количество потоков обработчика'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help='Пауза между опросами пустой очереди в секундах'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Выполнить доступные задачи и завершиться'
+        )
+
+    def handle(self, *args, **options):
+        stop = Event()
+        self.running = set()
+        self.running_lock = Lock()
+        self.stdout.write(
+            f'Обработчик задач запущен, потоков: {options["threads"]}'
+        )
+        with ThreadPoolExecutor(
+                max_workers=options['threads'] + 1
+        ) as executor:
+            beat = executor.submit(self.beat, stop)
+            loops = [
+                executor.submit(
+                    self.work,
+                    stop,
+                    options['poll_interval'],
+                    options['once']
+                )
+                for _ in range(options['threads'])
+            ]
+            try:
+                processed = sum(loop.result() for loop in loops)
+            except KeyboardInterrupt:
+                stop.set()
+                processed = sum(loop.result() for loop in loops)
+            stop.set()
+            beat.result()
+        self.stdout.write(
+            self.style.SUCCESS(f'Выполнено задач: {processed}')
+        )
+
+    def work(self, stop, poll_interval, once):
+        processed = 0
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                try:
+                    job = claim_job()
+                except DatabaseError:
+                    logger.exception('Не удалось получить задачу из очереди')
+                    if once:
+                        break
+                    stop.wait(poll_interval)
+                    continue
+                if job is None:
+                    if once:
+                        break
+                    stop.wait(poll_interval)
+                    continue
+                with self.running_lock:
+                    self.running.add(job.id)
+                try:
+                    job = run_job(job)
+                except DatabaseError:
+                    logger.exception(f'Не удалось сохранить результат {job}')
+                    stop.wait(poll_interval)
+                    continue
+                finally:
+                    with self.running_lock:
+                        self.running.discard(job.id)
+                    close_old_connections()
+                processed += 1
+                self.stdout.write(f'{job}: попытка {job.attempts}')
+        finally:
+            connection.close()
+        return processed
+
+    def beat(self, stop):
+        try:
+            while not stop.wait(settings.JOBS_HEARTBEAT_INTERVAL):
+                with self.running_lock:
+                    job_ids = list(self.running)
+                if not job_ids:
+                    continue
+                close_old_connections()
+                try:
+                    heartbeat(job_ids)
+                except DatabaseError:
+                    logger.exception('Не удалось продлить аренду задач')
+        finally:
+            connection.close()
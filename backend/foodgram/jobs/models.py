@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class Job(models.Model):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = (
+        (QUEUED, 'В очереди'),
+        (RUNNING, 'Выполняется'),
+        (DONE, 'Выполнена'),
+        (FAILED, 'Завершилась с ошибкой'),
+    )
+
+    name = models.CharField('Задача', max_length=200)
+    payload = models.TextField('Параметры задачи в JSON', default='{}')
+    status = models.CharField(
+        'Статус',
+        max_length=20,
+        choices=STATUSES,
+        default=QUEUED
+    )
+    user = models.ForeignKey(
+        User,
+        related_name='jobs',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name='Пользователь, который поставил задачу'
+    )
+    result = models.TextField('Результат', blank=True)
+    error = models.TextField('Ошибка', blank=True)
+    attempts = models.PositiveIntegerField('Количество попыток', default=0)
+    max_attempts = models.PositiveIntegerField(
+        'Максимальное количество попыток',
+        default=3
+    )
+    run_at = models.DateTimeField('Запустить не раньше', default=timezone.now)
+    heartbeat = models.DateTimeField(
+        'Последний сигнал обработчика',
+        null=True,
+        blank=True
+    )
+    created = models.DateTimeField('Дата создания', auto_now_add=True)
+    updated = models.DateTimeField('Дата изменения', auto_now=True)
+
+    class Meta:
+        ordering = ('-id',)
+        verbose_name = 'Фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        indexes = [
+            models.Index(fields=('status', 'run_at'), name='job_queue_idx')
+        ]
+
+    def __str__(self):
+        return f'Задача {self.name} ({self.get_status_display()})'
@@ -0,0 +1,113 @@
+import json
+from datetime import timedelta
+from time import monotonic
+from traceback import format_exc
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+
+TASKS = {}
+STALE_JOB_ERROR = 'Обработчик задачи перестал отвечать'
+
+_requeued = None
+
+
+def task(name):
+    def register(func):
+        TASKS[name] = func
+        return func
+    return register
+
+
+def enqueue(name, user=None, **payload):
+    job = Job.objects.create(
+        name=name,
+        user=user,
+        payload=json.dumps(payload),
+        max_attempts=settings.JOBS_MAX_ATTEMPTS
+    )
+    if settings.JOBS_EAGER:
+        Job.objects.filter(id=job.id).update(
+            status=Job.RUNNING,
+            attempts=F('attempts') + 1,
+            heartbeat=timezone.now()
+        )
+        job.refresh_from_db()
+        run_job(job)
+    return job
+
+
+def requeue_stale_jobs():
+    global _requeued
+    if (_requeued is not None and monotonic() - _requeued
+            < settings.JOBS_HEARTBEAT_INTERVAL):
+        return
+    _requeued = monotonic()
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status=Job.RUNNING,
+        heartbeat__lt=now - timedelta(seconds=settings.JOBS_LEASE_TIMEOUT)
+    )
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.FAILED,
+        error=STALE_JOB_ERROR
+    )
+    stale.update(status=Job.QUEUED, error=STALE_JOB_ERROR, run_at=now)
+
+
+def heartbeat(job_ids):
+    Job.objects.filter(id__in=job_ids, status=Job.RUNNING).update(
+        heartbeat=timezone.now()
+    )
+
+
+def claim_job():
+    requeue_stale_jobs()
+    queued = Job.objects.filter(
+        status=Job.QUEUED,
+        run_at__lte=timezone.now()
+    ).order_by('run_at', 'id')
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = queued.select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            job.status = Job.RUNNING
+            job.attempts += 1
+            job.heartbeat = timezone.now()
+            job.save(
+                update_fields=('status', 'attempts', 'heartbeat', 'updated')
+            )
+            return job
+    for job_id in queued.values_list('id', flat=True)[:10]:
+        if Job.objects.filter(id=job_id, status=Job.QUEUED).update(
+                status=Job.RUNNING,
+                attempts=F('attempts') + 1,
+                heartbeat=timezone.now()
+        ):
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def run_job(job):
+    try:
+        result = TASKS[job.name](**json.loads(job.payload))
+    except Exception:
+        job.error = format_exc()
+        if job.attempts >= job.max_attempts:
+            job.status = Job.FAILED
+        else:
+            job.status = Job.QUEUED
+            job.run_at = timezone.now() + timedelta(
+                seconds=settings.JOBS_RETRY_DELAY * 2 ** (job.attempts - 1)
+            )
+    else:
+        job.status = Job.DONE
+        job.result = '' if result is None else str(result)
+    job.save(update_fields=('status', 'result', 'error', 'run_at', 'updated'))
+    return job
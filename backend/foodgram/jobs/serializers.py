@@ -0,0 +1,17 @@
+from rest_framework.serializers import ModelSerializer
+
+from .models import Job
+
+
+class JobSerializer(ModelSerializer):
+    class Meta:
+        model = Job
+        fields = (
+            'id',
+            'name',
+            'status',
+            'attempts',
+            'result',
+            'created',
+            'updated'
+        )
@@ -0,0 +1,14 @@
+from rest_framework.viewsets import ReadOnlyModelViewSet
+
+from .models import Job
+from .serializers import JobSerializer
+from api.permissions import IsAuthenticatedOrAdmin
+
+
+class JobViewSet(ReadOnlyModelViewSet):
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    permission_classes = (IsAuthenticatedOrAdmin,)
+
+    def get_queryset(self):
+        return Job.objects.filter(user=self.request.user)
@@ -1,6 +1,9 @@
 from django.contrib import admin
 from django.contrib.admin import ModelAdmin
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 
+from foodgram.paginator import EstimatedCountPaginator
 from .models import (
     Basket,
     Favorites,
@@ -11,23 +14,70 @@ from .models import (
 )
 
 
+class TagAdmin(ModelAdmin):
+    list_display = ('name', 'slug', 'color')
+    search_fields = ('name', 'slug')
+
+
 class IngredientAdmin(ModelAdmin):
-    list_display = ('name', 'measurement_unit')
+    list_display = ('name', 'measurement_unit', 'calories', 'price')
     search_fields = ('name',)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+
+class IngredientRecipeAdmin(ModelAdmin):
+    list_display = ('ingredient', 'amount')
+    list_select_related = ('ingredient',)
+    search_fields = ('ingredient__name',)
+    autocomplete_fields = ('ingredient',)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
 
 class RecipeAdmin(ModelAdmin):
-    list_display = ('name', 'author', 'count_favorites')
-    list_filter = ('author', 'name', 'tags')
-    search_fields = ('name',)
+    list_display = ('name', 'author', 'count_favorites', 'calories', 'cost')
+    list_select_related = ('author',)
+    readonly_fields = ('calories', 'cost')
+    list_filter = ('tags',)
+    search_fields = ('name', 'author__username', 'author__email')
+    autocomplete_fields = ('author', 'tags', 'ingredients')
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            favorites_count=Coalesce(
+                Subquery(
+                    Favorites.objects.filter(
+                        recipe=OuterRef('pk')
+                    ).order_by().values('recipe').annotate(
+                        count=Count('pk')
+                    ).values('count'),
+                    output_field=IntegerField()
+                ),
+                Value(0)
+            )
+        )
 
     def count_favorites(self, obj):
-        return obj.favorites.count()
+        return obj.favorites_count
+    count_favorites.short_description = 'В избранном'
+    count_favorites.admin_order_field = 'favorites_count'
+
+
+class UserRecipeAdmin(ModelAdmin):
+    list_display = ('user', 'recipe', 'created')
+    list_select_related = ('user', 'recipe')
+    search_fields = ('user__username', 'user__email', 'recipe__name')
+    autocomplete_fields = ('user', 'recipe')
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
 
-admin.site.register(Tag)
+admin.site.register(Tag, TagAdmin)
 admin.site.register(Ingredient, IngredientAdmin)
 admin.site.register(Recipe, RecipeAdmin)
-admin.site.register(Favorites)
-admin.site.register(Basket)
-admin.site.register(IngredientRecipe)
+admin.site.register(Favorites, UserRecipeAdmin)
+admin.site.register(Basket, UserRecipeAdmin)
+admin.site.register(IngredientRecipe, IngredientRecipeAdmin)
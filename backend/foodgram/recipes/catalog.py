@@ -0,0 +1,194 @@
+import json
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+
+from .index import mark_recipe_changed
+from .models import Ingredient, IngredientRecipe, Recipe, Tag
+from .nutrition import update_recipe_totals
+from jobs.queue import enqueue
+from users.stats import reconcile_stats
+
+
+User = get_user_model()
+
+IMPORT_BATCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 500
+LOOKUP_CHUNK_SIZE = 500
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def export_recipes(chunk_size=EXPORT_CHUNK_SIZE):
+    last_id = 0
+    while True:
+        recipes = list(Recipe.objects.filter(
+            id__gt=last_id
+        ).order_by('id').select_related('author').prefetch_related(
+            'tags',
+            'ingredients__ingredient'
+        )[:chunk_size])
+        if not recipes:
+            return
+        for recipe in recipes:
+            yield json.dumps({
+                'name': recipe.name,
+                'text': recipe.text,
+                'cooking_time': recipe.cooking_time,
+                'image': recipe.image.name,
+                'author': recipe.author.email,
+                'tags': [tag.name for tag in recipe.tags.all()],
+                'ingredients': [
+                    {'name': item.ingredient.name, 'amount': item.amount}
+                    for item in recipe.ingredients.all()
+                ]
+            }, ensure_ascii=False) + '\n'
+        last_id = recipes[-1].id
+
+
+class CatalogImporter:
+    def __init__(self, default_author=None, batch_size=IMPORT_BATCH_SIZE):
+        self.default_author = default_author
+        self.batch_size = batch_size
+        self.tags = dict(Tag.objects.values_list('name', 'id'))
+        self.ingredients = dict(Ingredient.objects.values_list('name', 'id'))
+        self.created = []
+        self.errors = []
+
+    def run(self, lines):
+        rows = self.parse(lines)
+        for batch in chunked(rows, self.batch_size):
+            self.import_batch(batch)
+        if self.created:
+            author_ids = {recipe.author_id for recipe in self.created}
+            for chunk in chunked(author_ids, LOOKUP_CHUNK_SIZE):
+                reconcile_stats(User.objects.filter(id__in=chunk))
+            enqueue('recipes.update_similar_recipes')
+        return self.created, self.errors
+
+    def parse(self, lines):
+        for number, line in enumerate(lines, start=1):
+            try:
+                if isinstance(line, bytes):
+                    line = line.decode('utf-8')
+                if not line.strip():
+                    continue
+                yield self.parse_row(json.loads(line))
+            except ValidationError as error:
+                self.errors.append({
+                    'line': number,
+                    'error': ' '.join(error.messages)
+                })
+            except (AttributeError, KeyError, TypeError, ValueError) as error:
+                self.errors.append({'line': number, 'error': str(error)})
+
+    def parse_row(self, data):
+        tags = []
+        for name in data.get('tags', ()):
+            if name not in self.tags:
+                raise ValueError(f'Неизвестный тег: {name}')
+            tags.append(self.tags[name])
+        ingredients = {}
+        for item in data['ingredients']:
+            if item['name'] not in self.ingredients:
+                raise ValueError(f'Неизвестный ингредиент: {item["name"]}')
+            row = IngredientRecipe(amount=item['amount'])
+            row.clean_fields(exclude=('ingredient',))
+            ingredients[self.ingredients[item['name']]] = row.amount
+        if not ingredients:
+            raise ValueError('В рецепте нужен хотя бы 1 ингредиент')
+        recipe = Recipe(
+            name=data['name'],
+            text=data['text'],
+            cooking_time=data['cooking_time'],
+            image=data.get('image', '')
+        )
+        recipe.clean_fields(
+            exclude=('author', 'image') if not recipe.image else ('author',)
+        )
+        return recipe, data.get('author'), tags, ingredients
+
+    def resolve_authors(self, batch):
+        emails = {author for _, author, _, _ in batch if author}
+        authors = dict(User.objects.filter(
+            email__in=emails
+        ).values_list('email', 'id')) if emails else {}
+        resolved = []
+        for recipe, author, tags, ingredients in batch:
+            author_id = authors.get(author, getattr(
+                self.default_author,
+                'id',
+                None
+            ))
+            if author_id is None:
+                self.errors.append({
+                    'recipe': recipe.name,
+                    'error': f'Неизвестный автор: {author}'
+                })
+                continue
+            recipe.author_id = author_id
+            resolved.append((recipe, tags, ingredients))
+        return resolved
+
+    def resolve_ingredient_rows(self, pairs):
+        rows = {}
+        for ingredient_ids in chunked({pair[0] for pair in pairs},
+                                      LOOKUP_CHUNK_SIZE):
+            for row_id, ingredient_id, amount in (
+                    IngredientRecipe.objects.filter(
+                        ingredient_id__in=ingredient_ids
+                    ).values_list('id', 'ingredient_id', 'amount')
+            ):
+                rows[ingredient_id, amount] = row_id
+        return rows
+
+    def create_recipes(self, recipes):
+        if connection.features.can_return_ids_from_bulk_insert:
+            return Recipe.objects.bulk_create(recipes)
+        for recipe in recipes:
+            recipe.save()
+        return recipes
+
+    @transaction.atomic
+    def import_batch(self, batch):
+        batch = self.resolve_authors(batch)
+        if not batch:
+            return
+        pairs = {(ingredient_id, amount) for _, _, ingredients in batch
+                 for ingredient_id, amount in ingredients.items()}
+        rows = self.resolve_ingredient_rows(pairs)
+        missing = pairs.difference(rows)
+        if missing:
+            IngredientRecipe.objects.bulk_create(
+                [IngredientRecipe(ingredient_id=ingredient_id, amount=amount)
+                 for ingredient_id, amount in missing],
+                ignore_conflicts=True
+            )
+            rows = self.resolve_ingredient_rows(pairs)
+        recipes = self.create_recipes([recipe for recipe, _, _ in batch])
+        Recipe.tags.through.objects.bulk_create([
+            Recipe.tags.through(recipe_id=recipe.id, tag_id=tag_id)
+            for recipe, (_, tags, _) in zip(recipes, batch)
+            for tag_id in set(tags)
+        ])
+        Recipe.ingredients.through.objects.bulk_create([
+            Recipe.ingredients.through(
+                recipe_id=recipe.id,
+                ingredientrecipe_id=rows[ingredient_id, amount]
+            )
+            for recipe, (_, _, ingredients) in zip(recipes, batch)
+            for ingredient_id, amount in ingredients.items()
+        ])
+        recipe_ids = [recipe.id for recipe in recipes]
+        update_recipe_totals(Recipe.objects.filter(id__in=recipe_ids))
+        for recipe_id in recipe_ids:
+            mark_recipe_changed(recipe_id)
+        self.created.extend(recipes)
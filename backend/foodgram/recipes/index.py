@@ -0,0 +1,170 @@
+import logging
+from collections import defaultdict
+from operator import or_, sub
+from threading import Event, Lock, Thread
+from time import monotonic
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+
+from .models import Recipe
+
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_recipes(recipes):
+    ingredients = {
+        recipe_id: set()
+        for recipe_id in recipes.values_list('id', flat=True).iterator()
+    }
+    tags = defaultdict(set)
+    recipe_ingredients = Recipe.ingredients.through.objects.filter(
+        recipe__in=recipes
+    ).values_list('recipe_id', 'ingredientrecipe__ingredient_id')
+    for recipe_id, ingredient_id in recipe_ingredients.iterator():
+        if recipe_id in ingredients:
+            ingredients[recipe_id].add(ingredient_id)
+    recipe_tags = Recipe.tags.through.objects.filter(
+        recipe__in=recipes
+    ).values_list('recipe_id', 'tag__slug')
+    for recipe_id, slug in recipe_tags.iterator():
+        tags[recipe_id].add(slug)
+    return (
+        {recipe_id: frozenset(ids) for recipe_id, ids in ingredients.items()},
+        {recipe_id: frozenset(tags[recipe_id]) for recipe_id in ingredients}
+    )
+
+
+def merge_postings(postings, changes, operator):
+    for key, recipe_ids in changes.items():
+        posting = operator(postings.get(key, frozenset()), recipe_ids)
+        if posting:
+            postings[key] = posting
+        else:
+            postings.pop(key, None)
+
+
+def apply_changes(values, postings, new_values, recipe_ids):
+    added = defaultdict(set)
+    removed = defaultdict(set)
+    for recipe_id in recipe_ids:
+        old = values.get(recipe_id, frozenset())
+        new = new_values.get(recipe_id, frozenset())
+        for key in new - old:
+            added[key].add(recipe_id)
+        for key in old - new:
+            removed[key].add(recipe_id)
+    merge_postings(postings, added, or_)
+    for recipe_id in recipe_ids:
+        if recipe_id in new_values:
+            values[recipe_id] = new_values[recipe_id]
+        else:
+            values.pop(recipe_id, None)
+    merge_postings(postings, removed, sub)
+
+
+class RecipeIndex:
+    def __init__(self):
+        self.ingredients = {}
+        self.tags = {}
+        self.ingredient_postings = {}
+        self.tag_postings = {}
+        self.built = monotonic()
+
+    @classmethod
+    def build(cls):
+        index = cls()
+        ingredients, tags = fetch_recipes(Recipe.objects.all())
+        apply_changes(
+            index.ingredients,
+            index.ingredient_postings,
+            ingredients,
+            ingredients
+        )
+        apply_changes(index.tags, index.tag_postings, tags, tags)
+        return index
+
+    def refresh(self, recipe_ids):
+        ingredients, tags = fetch_recipes(
+            Recipe.objects.filter(id__in=recipe_ids)
+        )
+        apply_changes(
+            self.ingredients,
+            self.ingredient_postings,
+            ingredients,
+            recipe_ids
+        )
+        apply_changes(self.tags, self.tag_postings, tags, recipe_ids)
+
+    def with_tags(self, tags):
+        if not tags:
+            return set(self.ingredients)
+        recipe_ids = set()
+        for slug in tags:
+            recipe_ids |= self.tag_postings.get(slug, set())
+        return recipe_ids
+
+
+_index = None
+_dirty = set()
+_lock = Lock()
+_update_lock = Lock()
+_wakeup = Event()
+_updater = None
+
+
+def update_index(changed=()):
+    global _index
+    with _update_lock:
+        with _lock:
+            _dirty.update(changed)
+            recipe_ids = list(_dirty)
+            _dirty.clear()
+        try:
+            if (_index is None or monotonic() - _index.built
+                    > settings.RECIPE_INDEX_TIMEOUT):
+                _index = RecipeIndex.build()
+            elif recipe_ids:
+                _index.refresh(recipe_ids)
+        except DatabaseError:
+            with _lock:
+                _dirty.update(recipe_ids)
+            raise
+        return _index
+
+
+def run_updater():
+    while True:
+        _wakeup.wait(settings.RECIPE_INDEX_UPDATE_INTERVAL)
+        _wakeup.clear()
+        close_old_connections()
+        try:
+            update_index()
+        except DatabaseError:
+            logger.exception('Не удалось обновить индекс рецептов')
+
+
+def start_updater():
+    global _updater
+    with _lock:
+        if _updater is None or not _updater.is_alive():
+            _updater = Thread(target=run_updater, daemon=True)
+            _updater.start()
+
+
+def get_recipe_index(changed=()):
+    start_updater()
+    if changed or _index is None:
+        return update_index(changed)
+    return _index
+
+
+def mark_dirty(recipe_id):
+    with _lock:
+        _dirty.add(recipe_id)
+    _wakeup.set()
+
+
+def mark_recipe_changed(recipe_id):
+    transaction.on_commit(lambda: mark_dirty(recipe_id))
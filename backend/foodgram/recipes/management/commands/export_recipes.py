@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from recipes.catalog import EXPORT_CHUNK_SIZE, export_recipes
+
+
+class Command(BaseCommand):
+    help = 'Выгружает каталог рецептов в формате NDJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            nargs='?',
+            help='Путь к файлу, по умолчанию stdout'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE
+        )
+
+    def handle(self, *args, **options):
+        lines = export_recipes(options['chunk_size'])
+        if not options['path']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        with open(options['path'], 'w', encoding='utf-8') as file:
+            file.writelines(lines)
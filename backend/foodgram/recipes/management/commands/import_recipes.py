@@ -0,0 +1,43 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from recipes.catalog import IMPORT_BATCH_SIZE, CatalogImporter
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Загружает рецепты из файла NDJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Путь к файлу или - для stdin')
+        parser.add_argument(
+            '--author',
+            help='Почта автора для рецептов без известного автора'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=IMPORT_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        author = None
+        if options['author']:
+            author = User.objects.filter(email=options['author']).first()
+            if author is None:
+                raise CommandError(f'Нет пользователя {options["author"]}')
+        importer = CatalogImporter(author, options['batch_size'])
+        if options['path'] == '-':
+            created, errors = importer.run(sys.stdin)
+        else:
+            with open(options['path'], encoding='utf-8') as file:
+                created, errors = importer.run(file)
+        for error in errors:
+            self.stderr.write(str(error))
+        self.stdout.write(self.style.SUCCESS(
+            f'Загружено рецептов: {len(created)}, ошибок: {len(errors)}'
+        ))
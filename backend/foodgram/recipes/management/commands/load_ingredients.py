@@ -0,0 +1,100 @@
+import csv
+import os
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.mixins import invalidate_catalog
+from recipes.models import Ingredient, Recipe
+from recipes.nutrition import update_recipe_totals
+
+
+BATCH_SIZE = 500
+FIELDS = ('name', 'measurement_unit', 'calories', 'price')
+DEFAULTS = ['', '', '0', '0']
+
+
+class Command(BaseCommand):
+    help = ('Загружает ингредиенты из CSV: название, единица измерения '
+            'и, при наличии, калорийность и цена единицы измерения')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            nargs='?',
+            default=os.path.join(settings.BASE_DIR, 'data', 'ingredients.csv')
+        )
+
+    def read_rows(self, path):
+        rows = {}
+        with open(path, encoding='utf-8') as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            for row in reader:
+                if not row:
+                    continue
+                cells = [cell.strip() for cell in row[:len(FIELDS)]]
+                cells += DEFAULTS[len(cells):]
+                try:
+                    name, unit, calories, price = (
+                        Ingredient._meta.get_field(field).clean(
+                            cell or DEFAULTS[number],
+                            None
+                        )
+                        for number, (field, cell)
+                        in enumerate(zip(FIELDS, cells))
+                    )
+                except ValidationError as error:
+                    self.stderr.write(
+                        f'Строка {reader.line_num}: '
+                        f'{" ".join(error.messages)}'
+                    )
+                    continue
+                rows[name] = (unit, calories, price)
+        return rows
+
+    def handle(self, *args, **options):
+        rows = self.read_rows(options['path'])
+        existing = {
+            name: (ingredient_id, (unit, calories, price))
+            for ingredient_id, name, unit, calories, price
+            in Ingredient.objects.values_list(
+                'id', 'name', 'measurement_unit', 'calories', 'price'
+            )
+        }
+        created, updated, repriced = [], [], []
+        for name, (unit, calories, price) in rows.items():
+            ingredient_id, old = existing.get(name, (None, None))
+            if old == (unit, calories, price):
+                continue
+            ingredient = Ingredient(
+                id=ingredient_id,
+                name=name,
+                measurement_unit=unit,
+                calories=calories,
+                price=price
+            )
+            if ingredient_id is None:
+                created.append(ingredient)
+                continue
+            updated.append(ingredient)
+            if old[1:] != (calories, price):
+                repriced.append(ingredient_id)
+        with transaction.atomic():
+            Ingredient.objects.bulk_create(created, batch_size=BATCH_SIZE)
+            Ingredient.objects.bulk_update(
+                updated,
+                ('measurement_unit', 'calories', 'price'),
+                batch_size=BATCH_SIZE
+            )
+            if repriced:
+                update_recipe_totals(Recipe.objects.filter(
+                    ingredients__ingredient__in=repriced
+                ))
+        invalidate_catalog('ingredients')
+        self.stdout.write(self.style.SUCCESS(
+            f'Добавлено ингредиентов: {len(created)}, '
+            f'обновлено: {len(updated)}'
+        ))
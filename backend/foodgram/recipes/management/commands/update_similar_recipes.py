@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from recipes.index import RecipeIndex
+from recipes.models import SimilarRecipe
+from recipes.similarity import similar_rows
+
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает похожие рецепты для всего каталога'
+
+    def handle(self, *args, **options):
+        index = RecipeIndex.build()
+        batch = []
+        with transaction.atomic():
+            SimilarRecipe.objects.all().delete()
+            for recipe_id in index.ingredients:
+                batch.extend(similar_rows(index, recipe_id))
+                if len(batch) >= BATCH_SIZE:
+                    SimilarRecipe.objects.bulk_create(batch)
+                    batch = []
+            SimilarRecipe.objects.bulk_create(batch)
+        self.stdout.write(self.style.SUCCESS(
+            f'Обновлены похожие рецепты для {len(index.ingredients)} рецептов'
+        ))
@@ -0,0 +1,57 @@
+from collections import defaultdict
+from datetime import timedelta
+from math import exp, log
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from recipes.models import Basket, Favorites, Recipe
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает рейтинг популярности рецептов'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--half-life',
+            type=float,
+            default=settings.TRENDING_HALF_LIFE_DAYS,
+            help='Период полураспада рейтинга в днях'
+        )
+
+    def handle(self, *args, **options):
+        half_life = options['half_life']
+        decay = log(2) / half_life
+        today = timezone.now().date()
+        since = timezone.now() - timedelta(days=half_life * 10)
+        scores = defaultdict(float)
+        for model in (Favorites, Basket):
+            events = model.objects.filter(
+                created__gte=since
+            ).annotate(
+                day=TruncDate('created')
+            ).values('recipe_id', 'day').annotate(
+                count=Count('id')
+            ).values_list('recipe_id', 'day', 'count')
+            for recipe_id, day, count in events.iterator():
+                scores[recipe_id] += count * exp(-decay * (today - day).days)
+        recipes = [
+            Recipe(id=recipe_id, trending_score=score)
+            for recipe_id, score in scores.items()
+        ]
+        with transaction.atomic():
+            Recipe.objects.exclude(
+                id__in=scores
+            ).exclude(
+                trending_score=0
+            ).update(trending_score=0)
+            Recipe.objects.bulk_update(
+                recipes, ('trending_score',), batch_size=1000
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f'Обновлен рейтинг {len(scores)} рецептов')
+        )
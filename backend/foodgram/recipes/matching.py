@@ -0,0 +1,15 @@
+from collections import Counter
+
+
+def match_recipes(index, ingredient_ids):
+    matched = Counter()
+    for ingredient_id in set(ingredient_ids):
+        matched.update(index.ingredient_postings.get(ingredient_id, ()))
+    ranking = []
+    for recipe_id, count in matched.items():
+        total = len(index.ingredients.get(recipe_id, ()))
+        if not total:
+            continue
+        ranking.append((count / total, total - count, recipe_id))
+    ranking.sort(key=lambda item: (-item[0], item[1], -item[2]))
+    return ranking
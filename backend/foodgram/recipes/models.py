@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.utils import timezone
 
 
 User = get_user_model()
@@ -49,6 +50,20 @@ class Ingredient(models.Model):
         max_length=200,
         help_text='Необходимо указать единицу измерения ингредиента'
     )
+    calories = models.DecimalField(
+        'Калорийность, ккал',
+        max_digits=10,
+        decimal_places=3,
+        default=0,
+        help_text='Калорийность одной единицы измерения ингредиента'
+    )
+    price = models.DecimalField(
+        'Цена, руб.',
+        max_digits=10,
+        decimal_places=3,
+        default=0,
+        help_text='Цена одной единицы измерения ингредиента'
+    )
 
     class Meta:
         ordering = ('-id',)
@@ -120,11 +135,33 @@ class Recipe(models.Model):
         validators=(MinValueValidator(1),),
         help_text='Необходимо указать время приготовления рецепта'
     )
+    calories = models.DecimalField(
+        'Калорийность, ккал',
+        max_digits=12,
+        decimal_places=3,
+        default=0
+    )
+    cost = models.DecimalField(
+        'Стоимость, руб.',
+        max_digits=12,
+        decimal_places=3,
+        default=0
+    )
+    trending_score = models.FloatField(
+        'Рейтинг популярности',
+        default=0
+    )
 
     class Meta:
         ordering = ('-id',)
         verbose_name = 'Рецепт'
         verbose_name_plural = 'Рецепты'
+        indexes = [
+            models.Index(
+                fields=('-trending_score', '-id'),
+                name='recipe_trending_idx'
+            )
+        ]
 
     def __str__(self):
         return self.name
@@ -143,6 +180,11 @@ class Favorites(models.Model):
         on_delete=models.CASCADE,
         verbose_name='Рецепт в избранном'
     )
+    created = models.DateTimeField(
+        'Дата добавления',
+        default=timezone.now,
+        db_index=True
+    )
 
     class Meta:
         verbose_name = 'Избранное'
@@ -171,6 +213,11 @@ class Basket(models.Model):
         on_delete=models.CASCADE,
         verbose_name='Рецепты в корзине'
     )
+    created = models.DateTimeField(
+        'Дата добавления',
+        default=timezone.now,
+        db_index=True
+    )
 
     class Meta:
         verbose_name = 'Корзина'
@@ -184,3 +231,33 @@ class Basket(models.Model):
 
     def __str__(self):
         return f'{self.user} добавил рецепт {self.recipe} в корзину'
+
+
+class SimilarRecipe(models.Model):
+    recipe = models.ForeignKey(
+        Recipe,
+        related_name='similar',
+        on_delete=models.CASCADE,
+        verbose_name='Рецепт'
+    )
+    similar = models.ForeignKey(
+        Recipe,
+        related_name='+',
+        on_delete=models.CASCADE,
+        verbose_name='Похожий рецепт'
+    )
+    score = models.FloatField('Сходство')
+
+    class Meta:
+        ordering = ('-score', '-similar')
+        verbose_name = 'Похожий рецепт'
+        verbose_name_plural = 'Похожие рецепты'
+        constraints = [
+            models.UniqueConstraint(
+                fields=('recipe', 'similar'),
+                name='Похожий рецепт должен быть указан один раз'
+            )
+        ]
+
+    def __str__(self):
+        return f'Рецепт {self.similar} похож на {self.recipe}'
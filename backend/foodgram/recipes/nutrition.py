@@ -0,0 +1,36 @@
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import Recipe
+
+
+def ingredients_total(field):
+    output_field = DecimalField(max_digits=12, decimal_places=3)
+    totals = Recipe.ingredients.through.objects.filter(
+        recipe=OuterRef('pk')
+    ).order_by().values('recipe').annotate(
+        total=Sum(
+            F('ingredientrecipe__amount')
+            * F(f'ingredientrecipe__ingredient__{field}'),
+            output_field=output_field
+        )
+    ).values('total')
+    return Coalesce(
+        Subquery(totals, output_field=output_field),
+        Value(0),
+        output_field=output_field
+    )
+
+
+def update_recipe_totals(recipes):
+    recipes.update(
+        calories=ingredients_total('calories'),
+        cost=ingredients_total('price')
+    )
+
+
+def basket_totals(user):
+    return Recipe.objects.filter(baskets__user=user).aggregate(
+        calories=Coalesce(Sum('calories'), Value(0)),
+        cost=Coalesce(Sum('cost'), Value(0))
+    )
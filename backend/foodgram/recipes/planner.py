@@ -0,0 +1,38 @@
+from heapq import heapify, heappop, heappush
+
+
+def plan_meals(index, meals, tags=(), pantry=()):
+    covered = set(pantry)
+    missing = {}
+    queue = []
+    recipes = {}
+    for recipe_id in index.with_tags(tags):
+        ingredients = index.ingredients.get(recipe_id)
+        if ingredients is None:
+            continue
+        recipes[recipe_id] = ingredients
+        count = len(ingredients - covered) if covered else len(ingredients)
+        missing[recipe_id] = count
+        queue.append((count, count - len(ingredients), -recipe_id))
+    heapify(queue)
+    plan = []
+    while queue and len(plan) < meals:
+        count, _, recipe_id = heappop(queue)
+        recipe_id = -recipe_id
+        if missing.get(recipe_id) != count:
+            continue
+        del missing[recipe_id]
+        plan.append(recipe_id)
+        for ingredient_id in recipes[recipe_id] - covered:
+            covered.add(ingredient_id)
+            for other_id in index.ingredient_postings.get(ingredient_id, ()):
+                if other_id not in missing:
+                    continue
+                count = missing[other_id] - 1
+                missing[other_id] = count
+                heappush(queue, (
+                    count,
+                    count - len(recipes[other_id]),
+                    -other_id
+                ))
+    return plan, covered.difference(pantry)
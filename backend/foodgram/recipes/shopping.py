@@ -0,0 +1,22 @@
+from django.db.models import Sum
+
+from .models import IngredientRecipe
+from .units import UNMEASURED_UNITS, format_amount, normalize_amount
+
+
+def basket_ingredients(user):
+    return IngredientRecipe.objects.filter(
+        recipes__baskets__user=user
+    ).values_list(
+        'ingredient__name',
+        'ingredient__measurement_unit'
+    ).annotate(amount=Sum('amount')).order_by('ingredient__name')
+
+
+def shopping_list_lines(ingredients):
+    for name, unit, amount in ingredients:
+        if unit in UNMEASURED_UNITS:
+            yield f'* {name} ({unit})\n\n'
+            continue
+        amount, unit = normalize_amount(amount, unit)
+        yield f'* {name} ({unit}) -- {format_amount(amount)}\n\n'
@@ -0,0 +1,49 @@
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_save
+)
+from django.dispatch import receiver
+
+from .index import mark_recipe_changed
+from .models import Ingredient, Recipe
+from .nutrition import update_recipe_totals
+
+
+NUTRITION_FIELDS = ('calories', 'price')
+
+
+@receiver(m2m_changed, sender=Recipe.ingredients.through)
+@receiver(m2m_changed, sender=Recipe.tags.through)
+def recipe_relations_changed(sender, instance, action, reverse, pk_set,
+                             **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        mark_recipe_changed(instance.pk)
+        return
+    for recipe_id in pk_set or ():
+        mark_recipe_changed(recipe_id)
+
+
+@receiver(post_delete, sender=Recipe)
+def recipe_deleted(sender, instance, **kwargs):
+    mark_recipe_changed(instance.pk)
+
+
+@receiver(pre_save, sender=Ingredient)
+def ingredient_saving(sender, instance, **kwargs):
+    if instance.pk is None:
+        instance.saved_nutrition = None
+        return
+    instance.saved_nutrition = Ingredient.objects.filter(
+        pk=instance.pk
+    ).values_list(*NUTRITION_FIELDS).first()
+
+
+@receiver(post_save, sender=Ingredient)
+def ingredient_saved(sender, instance, created, **kwargs):
+    nutrition = tuple(getattr(instance, field) for field in NUTRITION_FIELDS)
+    if created or instance.saved_nutrition in (None, nutrition):
+        return
+    update_recipe_totals(
+        Recipe.objects.filter(ingredients__ingredient=instance)
+    )
@@ -0,0 +1,55 @@
+from collections import Counter
+from heapq import nlargest
+from math import sqrt
+
+from django.conf import settings
+from django.db import transaction
+
+from .index import get_recipe_index
+from .models import SimilarRecipe
+
+
+def find_similar(index, recipe_id, limit):
+    ingredients = index.ingredients.get(recipe_id)
+    if not ingredients:
+        return []
+    tags = index.tags.get(recipe_id, frozenset())
+    rare = [ingredient_id for ingredient_id in ingredients
+            if len(index.ingredient_postings.get(ingredient_id, ()))
+            <= settings.SIMILAR_RECIPES_MAX_POSTINGS]
+    candidates = Counter()
+    for ingredient_id in rare or ingredients:
+        candidates.update(index.ingredient_postings.get(ingredient_id, ()))
+    candidates.pop(recipe_id, None)
+    size = len(ingredients) + len(tags)
+    scores = []
+    for other_id in candidates:
+        other_ingredients = index.ingredients.get(other_id)
+        if other_ingredients is None:
+            continue
+        other_tags = index.tags.get(other_id, frozenset())
+        shared = (len(ingredients & other_ingredients)
+                  + len(tags & other_tags))
+        scores.append((
+            shared / sqrt(size * (len(other_ingredients) + len(other_tags))),
+            other_id
+        ))
+    return nlargest(limit, scores)
+
+
+def similar_rows(index, recipe_id):
+    return [
+        SimilarRecipe(recipe_id=recipe_id, similar_id=other_id, score=score)
+        for score, other_id in find_similar(
+            index,
+            recipe_id,
+            settings.SIMILAR_RECIPES_COUNT
+        )
+    ]
+
+
+def update_similar(recipe_id):
+    rows = similar_rows(get_recipe_index(changed=[recipe_id]), recipe_id)
+    with transaction.atomic():
+        SimilarRecipe.objects.filter(recipe_id=recipe_id).delete()
+        SimilarRecipe.objects.bulk_create(rows)
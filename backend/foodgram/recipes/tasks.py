@@ -0,0 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from .shopping import basket_ingredients, shopping_list_lines
+from .similarity import update_similar
+from jobs.queue import task
+
+
+User = get_user_model()
+
+
+@task('recipes.update_similar')
+def update_similar_task(recipe_id):
+    update_similar(recipe_id)
+
+
+@task('recipes.update_similar_recipes')
+def update_similar_recipes_task():
+    call_command('update_similar_recipes')
+
+
+@task('recipes.update_trending')
+def update_trending_task():
+    call_command('update_trending')
+
+
+@task('recipes.shopping_list')
+def shopping_list_task(user_id):
+    return ''.join(shopping_list_lines(
+        basket_ingredients(User.objects.get(id=user_id)).iterator()
+    ))
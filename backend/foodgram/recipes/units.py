@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+
+UNITS = {
+    'г': ('г', 1),
+    'кг': ('г', 1000),
+    'мл': ('мл', 1),
+    'л': ('мл', 1000),
+}
+DISPLAY_UNITS = {
+    'г': (('кг', 1000), ('г', 1)),
+    'мл': (('л', 1000), ('мл', 1)),
+}
+UNMEASURED_UNITS = ('по вкусу',)
+
+
+def normalize_amount(amount, unit):
+    if unit not in UNITS:
+        return Decimal(amount), unit
+    base_unit, factor = UNITS[unit]
+    amount = Decimal(amount) * factor
+    for display_unit, display_factor in DISPLAY_UNITS[base_unit]:
+        if amount >= display_factor:
+            return amount / display_factor, display_unit
+    return amount, base_unit
+
+
+def format_amount(amount):
+    return f'{amount.normalize():f}'
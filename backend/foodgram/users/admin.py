@@ -2,11 +2,23 @@ from django.contrib import admin
 from django.contrib.admin import ModelAdmin
 
 from .models import Follow, User
+from foodgram.paginator import EstimatedCountPaginator
 
 
 class UserAdmin(ModelAdmin):
     search_fields = ('email', 'username')
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+
+class FollowAdmin(ModelAdmin):
+    list_display = ('user', 'author')
+    list_select_related = ('user', 'author')
+    search_fields = ('user__username', 'author__username')
+    autocomplete_fields = ('user', 'author')
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
 
 admin.site.register(User, UserAdmin)
-admin.site.register(Follow)
+admin.site.register(Follow, FollowAdmin)
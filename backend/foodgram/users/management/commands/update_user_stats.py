@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from users.stats import reconcile_stats
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает статистику пользователей'
+
+    def handle(self, *args, **options):
+        count = reconcile_stats()
+        self.stdout.write(
+            self.style.SUCCESS(f'Обновлена статистика {count} пользователей')
+        )
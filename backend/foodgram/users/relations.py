@@ -0,0 +1,36 @@
+from django.utils.functional import cached_property
+
+from .models import Follow
+from recipes.models import Basket, Favorites
+
+
+class UserRelations:
+    def __init__(self, user):
+        self.user = user
+
+    def ids(self, queryset, field):
+        if self.user.is_anonymous:
+            return frozenset()
+        return frozenset(
+            queryset.filter(user=self.user).values_list(field, flat=True)
+        )
+
+    @cached_property
+    def following(self):
+        return self.ids(Follow.objects.all(), 'author_id')
+
+    @cached_property
+    def favorites(self):
+        return self.ids(Favorites.objects.all(), 'recipe_id')
+
+    @cached_property
+    def baskets(self):
+        return self.ids(Basket.objects.all(), 'recipe_id')
+
+
+def get_relations(request):
+    relations = getattr(request, 'relations', None)
+    if relations is None or relations.user != request.user:
+        relations = UserRelations(request.user)
+        request.relations = relations
+    return relations
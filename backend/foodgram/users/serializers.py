@@ -10,7 +10,8 @@ from rest_framework.serializers import (
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
 import api.serializers
-from .models import Follow
+from .models import Follow, UserStats
+from .relations import get_relations
 
 
 User = get_user_model()
@@ -50,13 +51,7 @@ class CustomUserSerializer(UserSerializer):
         )
 
     def get_is_subscribed(self, obj):
-        request = self.context.get('request')
-        if request.user.is_anonymous:
-            return False
-        return Follow.objects.filter(
-            user=request.user,
-            author=obj
-        ).exists()
+        return obj.id in get_relations(self.context.get('request')).following
 
 
 class FollowSerializer(ModelSerializer):
@@ -95,13 +90,7 @@ class FollowSerializer(ModelSerializer):
         return serializer.data
 
     def get_is_subscribed(self, obj):
-        request = self.context.get('request')
-        if request.user.is_anonymous:
-            return False
-        return Follow.objects.filter(
-            user=request.user,
-            author=obj
-        ).exists()
+        return obj.id in get_relations(self.context.get('request')).following
 
     def validate(self, data):
         user = self.context.get('request').user
@@ -125,3 +114,9 @@ class FollowSerializer(ModelSerializer):
         user = self.context.get('request').user
         author = validated_data.get('author')
         return Follow.objects.create(user=user, author=author)
+
+
+class UserStatsSerializer(ModelSerializer):
+    class Meta:
+        model = UserStats
+        fields = ('recipes_count', 'followers_count', 'favorites_count')
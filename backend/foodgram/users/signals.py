@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Follow
+from .stats import change_author_stats, change_stats
+from recipes.models import Favorites, Recipe
+
+
+@receiver(post_save, sender=Recipe)
+def recipe_created(sender, instance, created, **kwargs):
+    if created:
+        change_stats(instance.author_id, 'recipes_count', 1)
+
+
+@receiver(post_delete, sender=Recipe)
+def recipe_deleted(sender, instance, **kwargs):
+    change_stats(instance.author_id, 'recipes_count', -1)
+
+
+@receiver(post_save, sender=Follow)
+def follow_created(sender, instance, created, **kwargs):
+    if created:
+        change_stats(instance.author_id, 'followers_count', 1)
+
+
+@receiver(post_delete, sender=Follow)
+def follow_deleted(sender, instance, **kwargs):
+    change_stats(instance.author_id, 'followers_count', -1)
+
+
+@receiver(post_save, sender=Favorites)
+def favorite_created(sender, instance, created, **kwargs):
+    if created:
+        change_author_stats(instance.recipe_id, 'favorites_count', 1)
+
+
+@receiver(post_delete, sender=Favorites)
+def favorite_deleted(sender, instance, **kwargs):
+    change_author_stats(instance.recipe_id, 'favorites_count', -1)
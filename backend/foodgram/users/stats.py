@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Follow, UserStats
+from recipes.models import Favorites, Recipe
+
+
+User = get_user_model()
+
+STATS_FIELDS = ('recipes_count', 'followers_count', 'favorites_count')
+
+
+def count_by_user(queryset, field):
+    return Coalesce(
+        Subquery(
+            queryset.filter(
+                **{field: OuterRef('pk')}
+            ).order_by().values(field).annotate(
+                count=Count('pk')
+            ).values('count'),
+            output_field=IntegerField()
+        ),
+        Value(0)
+    )
+
+
+def stats_rows(users):
+    return users.order_by().annotate(
+        recipes_count=count_by_user(Recipe.objects.all(), 'author'),
+        followers_count=count_by_user(Follow.objects.all(), 'author'),
+        favorites_count=count_by_user(
+            Favorites.objects.all(),
+            'recipe__author'
+        )
+    ).values_list('pk', *STATS_FIELDS)
+
+
+def reconcile_stats(users=None):
+    if users is None:
+        users = User.objects.all()
+    stats = [
+        UserStats(
+            user_id=user_id,
+            recipes_count=recipes_count,
+            followers_count=followers_count,
+            favorites_count=favorites_count
+        )
+        for user_id, recipes_count, followers_count, favorites_count
+        in stats_rows(users)
+    ]
+    with transaction.atomic():
+        UserStats.objects.filter(user__in=users).delete()
+        UserStats.objects.bulk_create(
+            stats,
+            batch_size=1000,
+            ignore_conflicts=True
+        )
+    return len(stats)
+
+
+def create_stats(user_id):
+    row = stats_rows(User.objects.filter(pk=user_id)).first()
+    if row is None:
+        return None
+    stats, _ = UserStats.objects.update_or_create(
+        user_id=user_id,
+        defaults=dict(zip(STATS_FIELDS, row[1:]))
+    )
+    return stats
+
+
+def change_stats(user_id, field, delta):
+    updated = UserStats.objects.filter(user_id=user_id).update(
+        **{field: F(field) + delta}
+    )
+    if not updated and delta > 0:
+        create_stats(user_id)
+
+
+def change_author_stats(recipe_id, field, delta):
+    updated = UserStats.objects.filter(user__recipes=recipe_id).update(
+        **{field: F(field) + delta}
+    )
+    if not updated and delta > 0:
+        author_id = Recipe.objects.filter(
+            pk=recipe_id
+        ).values_list('author_id', flat=True).first()
+        if author_id is not None:
+            create_stats(author_id)
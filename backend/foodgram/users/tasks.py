@@ -0,0 +1,8 @@
+from jobs.queue import task
+
+from .stats import reconcile_stats
+
+
+@task('users.update_user_stats')
+def update_user_stats_task():
+    reconcile_stats()
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from djoser.views import UserViewSet
 from rest_framework.decorators import action
@@ -9,17 +10,25 @@ from rest_framework.status import (
     HTTP_400_BAD_REQUEST
 )
 
+from api.mixins import ReplicaReadMixin
 from api.permissions import IsAuthenticatedOrAdmin
-from .models import Follow
-from .serializers import CustomUserSerializer, FollowSerializer
+from events.broker import publish
+from .models import Follow, UserStats
+from .serializers import (
+    CustomUserSerializer,
+    FollowSerializer,
+    UserStatsSerializer
+)
+from .stats import create_stats
 
 
 User = get_user_model()
 
 
-class CustomUserViewSet(UserViewSet):
+class CustomUserViewSet(ReplicaReadMixin, UserViewSet):
     queryset = User.objects.all()
     serializer_class = CustomUserSerializer
+    throttle_scope = None
 
     @action(detail=False, permission_classes=(IsAuthenticatedOrAdmin,))
     def subscriptions(self, request):
@@ -32,9 +41,21 @@ class CustomUserViewSet(UserViewSet):
         )
         return self.get_paginated_response(serializer.data)
 
+    @action(detail=True)
+    def stats(self, request, **kwargs):
+        stats = UserStats.objects.filter(
+            user_id=self.kwargs.get('id')
+        ).first()
+        if stats is None:
+            stats = create_stats(self.kwargs.get('id'))
+        if stats is None:
+            raise Http404
+        return Response(UserStatsSerializer(stats).data)
+
     @action(methods=['post'],
             detail=True,
-            permission_classes=(IsAuthenticatedOrAdmin,)
+            permission_classes=(IsAuthenticatedOrAdmin,),
+            throttle_scope='toggle'
             )
     def subscribe(self, request, **kwargs):
         author = get_object_or_404(User, id=self.kwargs.get('id'))
@@ -48,6 +69,12 @@ class CustomUserViewSet(UserViewSet):
         data = {'author': author}
         serializer.create(data)
         serializer.save()
+        publish(
+            request.user.id,
+            'subscription',
+            author=author.id,
+            active=True
+        )
         return Response(serializer.data, status=HTTP_201_CREATED)
 
     @subscribe.mapping.delete
@@ -65,4 +92,10 @@ class CustomUserViewSet(UserViewSet):
             user=request.user,
             author=author
         ).delete()
+        publish(
+            request.user.id,
+            'subscription',
+            author=author.id,
+            active=False
+        )
         return Response(status=HTTP_204_NO_CONTENT)